@@ -2,117 +2,239 @@
 
 This module centralizes all configuration settings for the monitoring system,
 loading values from environment variables with sensible defaults.
+
+The environment is read exactly once at import into a frozen ``Config``
+instance (``CONFIG``); the module-level constants are aliases kept for
+backward compatibility with existing ``from config import X`` call sites.
 """
 import os
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
-MONITORING_DATA_DIR = os.getenv("MONITORING_DATA_DIR", "./monitoring/data")
-SNAPSHOTS_DIR = os.path.join(MONITORING_DATA_DIR, "snapshots")
-GROUPS_FILE = os.path.join(MONITORING_DATA_DIR, "groups.json")
-DOMAINS_FILE = os.path.join(MONITORING_DATA_DIR, "domains.json")
-
-MAX_CONCURRENT_CHECKS = int(os.getenv("MAX_CONCURRENT_CHECKS", "10"))
-
-DEFAULT_TIMEOUT_SECONDS = int(os.getenv("DEFAULT_TIMEOUT_SECONDS", "30"))
-
-SCREENSHOT_ENABLED = os.getenv("SCREENSHOT_ENABLED", "true").lower() == "true"
-
-MAX_DOMAINS_PER_GROUP = int(os.getenv("MAX_DOMAINS_PER_GROUP", "100"))
-
-SNAPSHOT_RETENTION_DAYS = int(os.getenv("SNAPSHOT_RETENTION_DAYS", "90"))
-
-MIN_CHECK_FREQUENCY_SECONDS = int(os.getenv("MIN_CHECK_FREQUENCY_SECONDS", "60"))
+def _env_bool(env, name: str, default: str) -> bool:
+    return env.get(name, default).lower() == "true"
 
-MAX_ASSET_SIZE_BYTES = int(os.getenv("MAX_ASSET_SIZE_BYTES", "52428800"))  # 50MB default
+def _parse_origins(value: str) -> Tuple[str, ...]:
+    """Split a comma-separated origin list, normalizing each entry once.
 
-MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
-
-RETRY_DELAY_SECONDS = float(os.getenv("RETRY_DELAY_SECONDS", "1.0"))
-
-RETRY_BACKOFF_MULTIPLIER = float(os.getenv("RETRY_BACKOFF_MULTIPLIER", "2.0"))
-
-ALERT_THRESHOLD = int(os.getenv("ALERT_THRESHOLD", "5"))
-
-SCREENSHOT_WIDTH = int(os.getenv("SCREENSHOT_WIDTH", "1920"))
-SCREENSHOT_HEIGHT = int(os.getenv("SCREENSHOT_HEIGHT", "1080"))
+    Browsers send ``Origin`` without surrounding whitespace or a trailing
+    slash, so both are stripped here and empty entries are dropped.
+    """
+    origins = (o.strip().rstrip('/') for o in value.split(','))
+    return tuple(dict.fromkeys(o for o in origins if o))
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Immutable snapshot of all configuration settings."""
+    monitoring_data_dir: Path
+    snapshots_dir: Path
+    groups_file: Path
+    domains_file: Path
+    max_concurrent_checks: int
+    default_timeout_seconds: int
+    screenshot_enabled: bool
+    max_domains_per_group: int
+    snapshot_retention_days: int
+    min_check_frequency_seconds: int
+    max_asset_size_bytes: int
+    max_retries: int
+    retry_delay_seconds: float
+    retry_backoff_multiplier: float
+    alert_threshold: int
+    screenshot_width: int
+    screenshot_height: int
+    screenshot_format: str
+    browser_type: str
+    browser_headless: bool
+    scheduler_timezone: str
+    scheduler_max_instances: int
+    scheduler_coalesce: bool
+    allowed_origins: Tuple[str, ...]
+    rate_limit_per_minute: int
+    nrd_dump_cache_ttl_seconds: float
+    log_level: str
+    log_file: str
+    json_logging: bool
+
+    @classmethod
+    def load(cls) -> 'Config':
+        """Build a Config from the current process environment."""
+        env = os.environ
+        data_dir = Path(env.get("MONITORING_DATA_DIR", "./monitoring/data"))
+
+        return cls(
+            monitoring_data_dir=data_dir,
+            snapshots_dir=data_dir / "snapshots",
+            groups_file=data_dir / "groups.json",
+            domains_file=data_dir / "domains.json",
+            max_concurrent_checks=int(env.get("MAX_CONCURRENT_CHECKS", "10")),
+            default_timeout_seconds=int(env.get("DEFAULT_TIMEOUT_SECONDS", "30")),
+            screenshot_enabled=_env_bool(env, "SCREENSHOT_ENABLED", "true"),
+            max_domains_per_group=int(env.get("MAX_DOMAINS_PER_GROUP", "100")),
+            snapshot_retention_days=int(env.get("SNAPSHOT_RETENTION_DAYS", "90")),
+            min_check_frequency_seconds=int(env.get("MIN_CHECK_FREQUENCY_SECONDS", "60")),
+            max_asset_size_bytes=int(env.get("MAX_ASSET_SIZE_BYTES", "52428800")),  # 50MB default
+            max_retries=int(env.get("MAX_RETRIES", "3")),
+            retry_delay_seconds=float(env.get("RETRY_DELAY_SECONDS", "1.0")),
+            retry_backoff_multiplier=float(env.get("RETRY_BACKOFF_MULTIPLIER", "2.0")),
+            alert_threshold=int(env.get("ALERT_THRESHOLD", "5")),
+            screenshot_width=int(env.get("SCREENSHOT_WIDTH", "1920")),
+            screenshot_height=int(env.get("SCREENSHOT_HEIGHT", "1080")),
+            screenshot_format=env.get("SCREENSHOT_FORMAT", "png"),
+            browser_type=env.get("BROWSER_TYPE", "chromium"),
+            browser_headless=_env_bool(env, "BROWSER_HEADLESS", "true"),
+            scheduler_timezone=env.get("SCHEDULER_TIMEZONE", "UTC"),
+            scheduler_max_instances=int(env.get("SCHEDULER_MAX_INSTANCES", "1")),
+            scheduler_coalesce=_env_bool(env, "SCHEDULER_COALESCE", "true"),
+            allowed_origins=_parse_origins(env.get(
+                'ALLOWED_ORIGINS',
+                'http://localhost:3000,http://127.0.0.1:3000'
+            )),
+            rate_limit_per_minute=int(env.get("RATE_LIMIT_PER_MINUTE", "0")),
+            nrd_dump_cache_ttl_seconds=float(env.get("NRD_DUMP_CACHE_TTL_SECONDS", "300")),
+            log_level=env.get("LOG_LEVEL", "INFO"),
+            log_file=env.get("LOG_FILE", ""),
+            json_logging=_env_bool(env, "JSON_LOGGING", "false"),
+        )
+
+CONFIG = Config.load()
+
+MONITORING_DATA_DIR = CONFIG.monitoring_data_dir
+SNAPSHOTS_DIR = CONFIG.snapshots_dir
+GROUPS_FILE = CONFIG.groups_file
+DOMAINS_FILE = CONFIG.domains_file
+
+MAX_CONCURRENT_CHECKS = CONFIG.max_concurrent_checks
+
+DEFAULT_TIMEOUT_SECONDS = CONFIG.default_timeout_seconds
+
+SCREENSHOT_ENABLED = CONFIG.screenshot_enabled
+
+MAX_DOMAINS_PER_GROUP = CONFIG.max_domains_per_group
+
+SNAPSHOT_RETENTION_DAYS = CONFIG.snapshot_retention_days
+
+MIN_CHECK_FREQUENCY_SECONDS = CONFIG.min_check_frequency_seconds
+
+MAX_ASSET_SIZE_BYTES = CONFIG.max_asset_size_bytes
+
+MAX_RETRIES = CONFIG.max_retries
+
+RETRY_DELAY_SECONDS = CONFIG.retry_delay_seconds
+
+RETRY_BACKOFF_MULTIPLIER = CONFIG.retry_backoff_multiplier
+
+ALERT_THRESHOLD = CONFIG.alert_threshold
+
+SCREENSHOT_WIDTH = CONFIG.screenshot_width
+SCREENSHOT_HEIGHT = CONFIG.screenshot_height
+
+SCREENSHOT_FORMAT = CONFIG.screenshot_format
+
+BROWSER_TYPE = CONFIG.browser_type
 
-SCREENSHOT_FORMAT = os.getenv("SCREENSHOT_FORMAT", "png")
+BROWSER_HEADLESS = CONFIG.browser_headless
 
-BROWSER_TYPE = os.getenv("BROWSER_TYPE", "chromium")
+SCHEDULER_TIMEZONE = CONFIG.scheduler_timezone
 
-BROWSER_HEADLESS = os.getenv("BROWSER_HEADLESS", "true").lower() == "true"
+SCHEDULER_MAX_INSTANCES = CONFIG.scheduler_max_instances
 
-SCHEDULER_TIMEZONE = os.getenv("SCHEDULER_TIMEZONE", "UTC")
+SCHEDULER_COALESCE = CONFIG.scheduler_coalesce
 
-SCHEDULER_MAX_INSTANCES = int(os.getenv("SCHEDULER_MAX_INSTANCES", "3"))
+ALLOWED_ORIGINS = CONFIG.allowed_origins
 
-SCHEDULER_COALESCE = os.getenv("SCHEDULER_COALESCE", "true").lower() == "true"
+RATE_LIMIT_PER_MINUTE = CONFIG.rate_limit_per_minute
 
-ALLOWED_ORIGINS = os.getenv(
-    'ALLOWED_ORIGINS', 
-    'http://localhost:3000,http://127.0.0.1:3000'
-).split(',')
+NRD_DUMP_CACHE_TTL_SECONDS = CONFIG.nrd_dump_cache_ttl_seconds
 
-RATE_LIMIT_PER_MINUTE = int(os.getenv("RATE_LIMIT_PER_MINUTE", "0"))
+LOG_LEVEL = CONFIG.log_level
 
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_FILE = CONFIG.log_file
 
-LOG_FILE = os.getenv("LOG_FILE", "")
+JSON_LOGGING = CONFIG.json_logging
 
-JSON_LOGGING = os.getenv("JSON_LOGGING", "false").lower() == "true"
+_directories_ready = False
 
 def ensure_directories() -> None:
-    """Create necessary directories if they don't exist."""
-    Path(MONITORING_DATA_DIR).mkdir(parents=True, exist_ok=True)
-    Path(SNAPSHOTS_DIR).mkdir(parents=True, exist_ok=True)
+    """Create necessary directories if they don't exist.
 
-def get_config_summary() -> dict:
-    """Get a summary of current configuration settings.
-    
-    Returns:
-        Dictionary containing all configuration values
+    The snapshots directory lives inside the data directory, so a single
+    ``mkdir(parents=True)`` creates both; later calls are a flag check.
     """
+    global _directories_ready
+    if _directories_ready:
+        return
+    SNAPSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+    _directories_ready = True
+
+def _build_config_summary() -> dict:
     return {
         'directories': {
-            'monitoring_data_dir': MONITORING_DATA_DIR,
-            'snapshots_dir': SNAPSHOTS_DIR,
-            'groups_file': GROUPS_FILE,
-            'domains_file': DOMAINS_FILE,
+            'monitoring_data_dir': str(CONFIG.monitoring_data_dir),
+            'snapshots_dir': str(CONFIG.snapshots_dir),
+            'groups_file': str(CONFIG.groups_file),
+            'domains_file': str(CONFIG.domains_file),
         },
         'monitoring': {
-            'max_concurrent_checks': MAX_CONCURRENT_CHECKS,
-            'default_timeout_seconds': DEFAULT_TIMEOUT_SECONDS,
-            'screenshot_enabled': SCREENSHOT_ENABLED,
-            'max_domains_per_group': MAX_DOMAINS_PER_GROUP,
-            'snapshot_retention_days': SNAPSHOT_RETENTION_DAYS,
-            'min_check_frequency_seconds': MIN_CHECK_FREQUENCY_SECONDS,
-            'max_asset_size_bytes': MAX_ASSET_SIZE_BYTES,
+            'max_concurrent_checks': CONFIG.max_concurrent_checks,
+            'default_timeout_seconds': CONFIG.default_timeout_seconds,
+            'screenshot_enabled': CONFIG.screenshot_enabled,
+            'max_domains_per_group': CONFIG.max_domains_per_group,
+            'snapshot_retention_days': CONFIG.snapshot_retention_days,
+            'min_check_frequency_seconds': CONFIG.min_check_frequency_seconds,
+            'max_asset_size_bytes': CONFIG.max_asset_size_bytes,
         },
         'error_handling': {
-            'max_retries': MAX_RETRIES,
-            'retry_delay_seconds': RETRY_DELAY_SECONDS,
-            'retry_backoff_multiplier': RETRY_BACKOFF_MULTIPLIER,
-            'alert_threshold': ALERT_THRESHOLD,
+            'max_retries': CONFIG.max_retries,
+            'retry_delay_seconds': CONFIG.retry_delay_seconds,
+            'retry_backoff_multiplier': CONFIG.retry_backoff_multiplier,
+            'alert_threshold': CONFIG.alert_threshold,
         },
         'screenshot': {
-            'width': SCREENSHOT_WIDTH,
-            'height': SCREENSHOT_HEIGHT,
-            'format': SCREENSHOT_FORMAT,
-            'browser_type': BROWSER_TYPE,
-            'browser_headless': BROWSER_HEADLESS,
+            'width': CONFIG.screenshot_width,
+            'height': CONFIG.screenshot_height,
+            'format': CONFIG.screenshot_format,
+            'browser_type': CONFIG.browser_type,
+            'browser_headless': CONFIG.browser_headless,
         },
         'scheduler': {
-            'timezone': SCHEDULER_TIMEZONE,
-            'max_instances': SCHEDULER_MAX_INSTANCES,
-            'coalesce': SCHEDULER_COALESCE,
+            'timezone': CONFIG.scheduler_timezone,
+            'max_instances': CONFIG.scheduler_max_instances,
+            'coalesce': CONFIG.scheduler_coalesce,
         },
         'api': {
-            'allowed_origins': ALLOWED_ORIGINS,
-            'rate_limit_per_minute': RATE_LIMIT_PER_MINUTE,
+            'allowed_origins': CONFIG.allowed_origins,
+            'rate_limit_per_minute': CONFIG.rate_limit_per_minute,
+            'nrd_dump_cache_ttl_seconds': CONFIG.nrd_dump_cache_ttl_seconds,
         },
         'logging': {
-            'log_level': LOG_LEVEL,
-            'log_file': LOG_FILE,
-            'json_logging': JSON_LOGGING,
+            'log_level': CONFIG.log_level,
+            'log_file': CONFIG.log_file,
+            'json_logging': CONFIG.json_logging,
         }
     }
+
+# The configuration is immutable after import, so the summary is built once
+# and shared behind read-only views.
+_SUMMARY = MappingProxyType({
+    section: MappingProxyType(values)
+    for section, values in _build_config_summary().items()
+})
+
+def get_config_summary() -> Mapping[str, Mapping[str, object]]:
+    """Get a summary of current configuration settings.
+
+    Returns:
+        Read-only mapping of configuration sections to their values
+    """
+    return _SUMMARY
+
+def get_config_summary_copy() -> dict:
+    """Get a mutable copy of the configuration summary.
+
+    Returns:
+        Dictionary containing all configuration values
+    """
+    return {section: dict(values) for section, values in _SUMMARY.items()}
@@ -1,20 +1,25 @@
-from fastapi import FastAPI, HTTPException, status
+from fastapi import FastAPI, HTTPException, Query, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
-import subprocess
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
+import anyio
+import asyncio
+import importlib
 import os
+import shutil
 import logging
+import orjson
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from typing import List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from pathlib import Path
 
 import config
 
-from plugins.file_utils import get_latest_nrd_domains
-from plugins.brand_search import brand_search as run_brand_search
+from plugins.file_utils import get_latest_nrd_domains, find_latest_nrd_file, count_domains_in_file, clear_nrd_cache
 from plugins.log_utils import clean_log
-from plugins.whois_query import get_whois_info
-from fastapi import Query
 
 from scheduler import get_scheduler
 
@@ -29,46 +34,99 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI(
-    title="VigilWolf Domain Monitoring API",
-    description="API for monitoring domain changes and capturing snapshots",
-    version="1.0.0"
-)
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, which writes bytes directly."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+class LargeFileResponse(FileResponse):
+    """FileResponse that reads in 256 KiB chunks for multi-MB screenshots."""
+    chunk_size = 1 << 18
+
+# CPython only launches children via posix_spawn() (instead of fork+exec)
+# when the executable path is absolute and close_fds is False.
+BASH_EXECUTABLE = shutil.which("bash") or "bash"
 
-@app.on_event("startup")
-async def startup_event():
+async def startup_event(app: FastAPI):
     """Initialize and start the monitoring system on application startup.
     
     Startup sequence:
-    1. Ensure required directories exist
+    1. Size the worker thread pools and ensure required directories exist
     2. Load existing state (groups and domains)
     3. Start the background scheduler
     4. Schedule checks for all active domains
+    5. Warm plugin modules and the latest NRD file lookup
     """
     logger.info("Starting Domain Monitoring System...")
     
     try:
+        configure_thread_limiter()
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=DEFAULT_EXECUTOR_WORKERS, thread_name_prefix="vigilwolf")
+        )
         config.ensure_directories()
         logger.info(f"Monitoring data directory: {config.MONITORING_DATA_DIR}")
         
-        storage = get_storage_manager()
-        groups = storage.load_groups()
-        domains = storage.load_domains()
-        logger.info(f"Loaded {len(groups)} groups and {len(domains)} domains from storage")
+        # Resolve the service singletons once; handlers read them from app.state.
+        storage = app.state.storage = get_storage_manager()
+        app.state.monitoring = get_monitoring_service()
+        scheduler = app.state.scheduler = get_scheduler()
+        
+        domain_count, _ = storage.count_domains()
+        logger.info(f"Loaded {storage.count_groups()} groups and {domain_count} domains from storage")
         
-        scheduler = get_scheduler()
         scheduler.start_scheduler()
         logger.info("Background scheduler started successfully")
         
-        logger.info(f"Configuration: {config.get_config_summary()}")
+        logger.info(f"Configuration: {config.get_config_summary_copy()}")
+        
+        await warm_caches()
         
         logger.info("Domain Monitoring System startup complete")
     except Exception as e:
         logger.error(f"Error during startup: {str(e)}", exc_info=True)
         raise
 
-@app.on_event("shutdown")
-async def shutdown_event():
+# Workers for the loop's default executor (run_in_executor(None, ...) and
+# asyncio.to_thread), which only serves short startup and /dump-nrd steps.
+DEFAULT_EXECUTOR_WORKERS = 4
+
+def available_cpu_count() -> int:
+    """Number of CPUs this process may run on (honours affinity/cpusets)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+def configure_thread_limiter():
+    """Size the AnyIO worker thread pool used for sync endpoints and to_thread calls.
+
+    Sync plugin work (NRD file reads, WHOIS lookups) blocks in IO rather than CPU,
+    so the pool is scaled to the CPU budget instead of AnyIO's fixed default of 40.
+    """
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(64, 8 * available_cpu_count())
+    logger.info(f"Worker thread limit set to {limiter.total_tokens}")
+
+async def warm_caches():
+    """Pre-import request plugins and resolve the latest NRD file.
+
+    The steps are independent blocking work, so they run concurrently in
+    worker threads and startup only waits for the slowest one.
+    """
+    results = await asyncio.gather(
+        asyncio.to_thread(find_latest_nrd_file),
+        asyncio.to_thread(importlib.import_module, "plugins.brand_search"),
+        asyncio.to_thread(importlib.import_module, "plugins.whois_query"),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning(f"Cache warm-up step failed: {str(result)}")
+
+async def shutdown_event(app: FastAPI):
     """Stop the monitoring system gracefully on application shutdown.
     
     Shutdown sequence:
@@ -80,86 +138,180 @@ async def shutdown_event():
     logger.info("Shutting down Domain Monitoring System...")
     
     try:
-        scheduler = get_scheduler()
+        scheduler = app.state.scheduler
         scheduler.stop_scheduler()
         logger.info("Background scheduler stopped successfully")
         
-        storage = get_storage_manager()
-        groups = storage.load_groups()
-        domains = storage.load_domains()
-        logger.info(f"Final state: {len(groups)} groups, {len(domains)} domains")
+        app.state.monitoring.shutdown()
+        app.state.monitoring.capture.cleanup()
+        
+        storage = app.state.storage
+        domain_count, _ = storage.count_domains()
+        logger.info(f"Final state: {storage.count_groups()} groups, {domain_count} domains")
         
         logger.info("Domain Monitoring System shutdown complete")
     except Exception as e:
         logger.error(f"Error during shutdown: {str(e)}", exc_info=True)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the monitoring system startup and shutdown around the app's lifetime."""
+    await startup_event(app)
+    try:
+        yield
+    finally:
+        await shutdown_event(app)
+
+app = FastAPI(
+    title="VigilWolf Domain Monitoring API",
+    description="API for monitoring domain changes and capturing snapshots",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=config.ALLOWED_ORIGINS,
+    # A frozenset turns Starlette's per-request `origin in allow_origins`
+    # check into a hash lookup.
+    allow_origins=frozenset(config.CONFIG.allowed_origins),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-@app.get('/whois')
+# NRD and brand-search payloads are long lists of domain names that compress
+# very well; a modest level keeps the CPU cost per response low.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+@app.get('/whois', response_model=None)
 async def whois_query(domain: str = Query(...)):
-    result = get_whois_info(domain)
-    return result
+    from plugins.whois_query import get_whois_info_async
+
+    result = await get_whois_info_async(domain)
+    return ORJSONResponse(result)
 
-@app.get("/health")
-async def health_check():
+# Last serialized /health body and the state it was built from. A fresh
+# Response is created per request because middleware mutates its headers.
+_health_cache: Dict[str, Any] = {"key": None, "body": b""}
+
+@app.get("/health", response_model=None)
+async def health_check(request: Request):
     """Health check endpoint that verifies system status.
     
+    The body only changes when the scheduler state or the group/domain counts
+    change, so it is serialized once per state and reused for probes.
+    
     Returns:
         Status information including scheduler state and system readiness
     """
     try:
-        scheduler = get_scheduler()
+        scheduler = request.app.state.scheduler
         scheduler_running = scheduler.scheduler is not None and scheduler.scheduler.running
         
-        storage = get_storage_manager()
-        groups = storage.load_groups()
-        domains = storage.load_domains()
-        active_domains = sum(1 for d in domains if d.active)
+        storage = request.app.state.storage
+        groups_count = storage.count_groups()
+        domains_count, active_domains = storage.count_domains()
+        
+        state_key = (scheduler_running, groups_count, domains_count, active_domains)
+        if state_key != _health_cache["key"]:
+            _health_cache["body"] = orjson.dumps({
+                "status": "ok",
+                "scheduler_running": scheduler_running,
+                "groups_count": groups_count,
+                "domains_count": domains_count,
+                "active_domains_count": active_domains,
+                "config": {
+                    "monitoring_data_dir": str(config.MONITORING_DATA_DIR),
+                    "screenshot_enabled": config.SCREENSHOT_ENABLED,
+                    "max_concurrent_checks": config.MAX_CONCURRENT_CHECKS
+                }
+            })
+            _health_cache["key"] = state_key
         
-        return {
-            "status": "ok",
-            "scheduler_running": scheduler_running,
-            "groups_count": len(groups),
-            "domains_count": len(domains),
-            "active_domains_count": active_domains,
-            "config": {
-                "monitoring_data_dir": config.MONITORING_DATA_DIR,
-                "screenshot_enabled": config.SCREENSHOT_ENABLED,
-                "max_concurrent_checks": config.MAX_CONCURRENT_CHECKS
-            }
-        }
+        return Response(content=_health_cache["body"], media_type="application/json")
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}", exc_info=True)
-        return {
+        return ORJSONResponse({
             "status": "error",
             "error": str(e)
-        }
+        })
+
+# Domain lists above this size are streamed in batches instead of being
+# serialized into a single response body.
+NRD_STREAM_THRESHOLD = 10_000
+NRD_STREAM_BATCH_SIZE = 5_000
+
+def _stream_nrd_payload(filename: str, domains: List[str], total: int):
+    """Yield the /nrd-latest JSON document in orjson-encoded chunks."""
+    yield b'{"filename":' + orjson.dumps(filename) + b',"domains":['
+    for start in range(0, len(domains), NRD_STREAM_BATCH_SIZE):
+        chunk = orjson.dumps(domains[start:start + NRD_STREAM_BATCH_SIZE])[1:-1]
+        yield chunk if start == 0 else b',' + chunk
+    yield b'],"total":' + orjson.dumps(total) + b'}'
+
+# Serialized /nrd-latest pages, keyed on (path, mtime_ns, size, limit, offset)
+# so a replaced or rewritten NRD file never serves stale bytes.
+NRD_RESPONSE_CACHE_SIZE = 64
+_nrd_response_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+
+@app.get('/nrd-latest', response_model=None)
+async def nrd_latest(request: Request, limit: int | None = Query(None), offset: int = Query(0)):
+    filepath = find_latest_nrd_file()
+    try:
+        st = os.stat(filepath) if filepath else None
+    except OSError:
+        st = None
+    
+    headers = {}
+    cache_key = None
+    if st is not None:
+        etag = f'W/"{st.st_mtime_ns:x}-{st.st_size:x}-{offset}-{limit}"'
+        headers = {"ETag": etag, "Cache-Control": "public, max-age=60"}
+        if_none_match = request.headers.get("if-none-match", "")
+        if etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        
+        cache_key = (filepath, st.st_mtime_ns, st.st_size, limit, offset)
+        body = _nrd_response_cache.get(cache_key)
+        if body is not None:
+            _nrd_response_cache.move_to_end(cache_key)
+            return Response(content=body, media_type="application/json", headers=headers)
 
-@app.get('/nrd-latest')
-async def nrd_latest(limit: int | None = Query(None), offset: int = Query(0)):
-    filename, domains, total = get_latest_nrd_domains(limit=limit, offset=offset)
-    return {"filename": filename, "domains": domains, "total": total}
+    filename, domains, total = await anyio.to_thread.run_sync(get_latest_nrd_domains, limit, offset)
+    if len(domains) > NRD_STREAM_THRESHOLD:
+        return StreamingResponse(
+            _stream_nrd_payload(filename, domains, total),
+            media_type="application/json",
+            headers=headers
+        )
+    
+    body = orjson.dumps({"filename": filename, "domains": domains, "total": total})
+    if cache_key is not None:
+        _nrd_response_cache[cache_key] = body
+        if len(_nrd_response_cache) > NRD_RESPONSE_CACHE_SIZE:
+            _nrd_response_cache.popitem(last=False)
+    return Response(content=body, media_type="application/json", headers=headers)
 
-@app.post('/brand-search')
-async def brand_search(payload: dict, limit: int = Query(100), offset: int = Query(0)):
-    from plugins.file_utils import find_latest_nrd_file
+class BrandSearchRequest(BaseModel):
+    """Request model for brand search."""
+    brand: str = Field(..., min_length=1, description="Brand name to search for (cannot be empty)")
 
-    brand = payload.get('brand') if isinstance(payload, dict) else None
-    if not brand or not isinstance(brand, str):
-        return {"results": [], "total": 0}
+@app.post('/brand-search', response_model=None)
+async def brand_search(request: BrandSearchRequest, limit: int = Query(100), offset: int = Query(0)):
+    from plugins.brand_search import brand_search as run_brand_search
 
+    brand = request.brand
     filepath = find_latest_nrd_file()
     if not filepath:
-        return {"results": [], "total": 0}
+        return ORJSONResponse({"results": [], "total": 0})
+
+    data = await anyio.to_thread.run_sync(run_brand_search, brand, filepath, limit, offset)
+    return ORJSONResponse({"results": data.get("results", []), "total": data.get("total", 0)})
 
-    data = run_brand_search(brand, filepath, limit=limit, offset=offset)
-    return {"results": data.get("results", []), "total": data.get("total", 0)}
+# Single in-flight NRD download task, shared by concurrent callers, plus the
+# last successful result, which is served for NRD_DUMP_CACHE_TTL_SECONDS.
+_dump_state: Dict[str, Any] = {"task": None, "result": None, "ts": 0.0}
 
 @app.get("/dump-nrd")
 async def dump_nrd():
@@ -169,60 +321,60 @@ async def dump_nrd():
     for the past 7 days. If some days fail to download (corrupted files, unavailable data),
     the script will skip those days and continue with available data.
     
+    Only one download runs at a time: callers arriving while it is running wait
+    for and share its result, and a recent successful result is returned
+    without re-running the script.
+    
     Returns:
         Status and output/error information from the download process
     """
+    loop = asyncio.get_running_loop()
+    result = _dump_state["result"]
+    if result is not None and loop.time() - _dump_state["ts"] < config.CONFIG.nrd_dump_cache_ttl_seconds:
+        return result
+    
+    task = _dump_state["task"]
+    if task is None:
+        task = asyncio.create_task(_run_nrd_dump())
+        task.add_done_callback(_finish_nrd_dump)
+        _dump_state["task"] = task
+    
+    # Shielded so one caller disconnecting doesn't cancel the shared download.
+    return await asyncio.shield(task)
+
+def _finish_nrd_dump(task: asyncio.Task) -> None:
+    """Clear the in-flight download and cache its result if it succeeded."""
+    if _dump_state["task"] is task:
+        _dump_state["task"] = None
+    if task.cancelled() or task.exception() is not None:
+        return
+    result = task.result()
+    if result.get("status") == "Download Successful":
+        _dump_state["result"] = result
+        _dump_state["ts"] = task.get_loop().time()
+
+async def _run_nrd_dump() -> Dict[str, Any]:
+    """Run nrd-fix-portable.sh once and summarize its outcome."""
     try:
         logger.info("Starting NRD download process...")
-        result = subprocess.run(
-            ["bash", "./nrd-fix-portable.sh"],
-            capture_output=True,
-            text=True,
-            check=False  # Don't raise exception on non-zero exit
+        proc = await asyncio.create_subprocess_exec(
+            BASH_EXECUTABLE, "./nrd-fix-portable.sh",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            close_fds=False
         )
+        try:
+            stdout, stderr = await proc.communicate()
+        except asyncio.CancelledError:
+            # Don't leave the download script running without a reader.
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            raise
 
-        cleaned_stdout = clean_log(result.stdout)
-        cleaned_stderr = clean_log(result.stderr)
-        
-        # Check if we got any domains even if there were some failures
-        from plugins.file_utils import find_latest_nrd_file
-        latest_file = find_latest_nrd_file()
-        
-        if latest_file and os.path.exists(latest_file):
-            # Count domains (excluding comments and empty lines)
-            try:
-                with open(latest_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    domain_count = sum(1 for line in f if line.strip() and not line.strip().startswith('#'))
-                
-                if domain_count > 0:
-                    logger.info(f"NRD download completed with {domain_count} domains")
-                    return {
-                        "status": "Download Successful",
-                        "output": cleaned_stdout,
-                        "domain_count": domain_count,
-                        "file": os.path.basename(latest_file),
-                        "warnings": cleaned_stderr if cleaned_stderr else None
-                    }
-            except Exception as e:
-                logger.warning(f"Error counting domains: {e}")
-        
-        # If we get here, either no file was created or it's empty
-        if result.returncode != 0:
-            logger.error(f"NRD download failed with return code {result.returncode}")
-            return {
-                "status": "Download Failed",
-                "error": cleaned_stderr or cleaned_stdout,
-                "message": "All NRD sources failed or were unavailable. Please try again later."
-            }
-        else:
-            logger.warning("NRD download completed but no domains were found")
-            return {
-                "status": "Download Completed with Warnings",
-                "output": cleaned_stdout,
-                "warnings": cleaned_stderr,
-                "message": "Download completed but no valid domain data was found."
-            }
-            
+        # Log cleanup and the domain count scan are blocking work, so the
+        # whole post-processing step runs in one call on a worker thread.
+        return await asyncio.to_thread(_summarize_nrd_dump, stdout, stderr, proc.returncode)
     except Exception as e:
         logger.error(f"Unexpected error during NRD download: {str(e)}", exc_info=True)
         return {
@@ -231,40 +383,86 @@ async def dump_nrd():
             "message": "An unexpected error occurred during the download process."
         }
 
+def _summarize_nrd_dump(stdout: bytes, stderr: bytes, returncode: int) -> Dict[str, Any]:
+    """Clean the NRD script output and build the /dump-nrd result (blocking)."""
+    cleaned_stdout = clean_log(stdout)
+    cleaned_stderr = clean_log(stderr)
+    
+    # The script may have rewritten files in place; drop anything cached.
+    clear_nrd_cache()
+    
+    # Check if we got any domains even if there were some failures
+    latest_file = find_latest_nrd_file()
+    
+    if latest_file and os.path.exists(latest_file):
+        # Count domains (excluding comments and empty lines)
+        try:
+            domain_count = count_domains_in_file(latest_file)
+            
+            if domain_count > 0:
+                logger.info(f"NRD download completed with {domain_count} domains")
+                return {
+                    "status": "Download Successful",
+                    "output": cleaned_stdout,
+                    "domain_count": domain_count,
+                    "file": os.path.basename(latest_file),
+                    "warnings": cleaned_stderr if cleaned_stderr else None
+                }
+        except Exception as e:
+            logger.warning(f"Error counting domains: {e}")
+    
+    # If we get here, either no file was created or it's empty
+    if returncode != 0:
+        logger.error(f"NRD download failed with return code {returncode}")
+        return {
+            "status": "Download Failed",
+            "error": cleaned_stderr or cleaned_stdout,
+            "message": "All NRD sources failed or were unavailable. Please try again later."
+        }
+    else:
+        logger.warning("NRD download completed but no domains were found")
+        return {
+            "status": "Download Completed with Warnings",
+            "output": cleaned_stdout,
+            "warnings": cleaned_stderr,
+            "message": "Download completed but no valid domain data was found."
+        }
+
 class DomainConfigRequest(BaseModel):
     """Request model for domain configuration."""
+    model_config = ConfigDict(extra='forbid', frozen=True)
+    
     url: str = Field(..., description="Domain URL (must start with http:// or https://)")
     dump_mode: str = Field(..., description="Dump mode: 'html_only' or 'html_and_assets'")
     frequency_seconds: int = Field(..., gt=0, description="Check frequency in seconds (must be positive)")
 
 class CreateGroupRequest(BaseModel):
     """Request model for creating a monitoring group."""
+    model_config = ConfigDict(extra='forbid', frozen=True)
+    
     name: str = Field(..., min_length=1, description="Group name (cannot be empty)")
     domains: List[DomainConfigRequest] = Field(..., min_length=1, description="List of domain configurations")
 
-@app.post("/monitoring/groups", status_code=status.HTTP_201_CREATED)
-async def create_monitoring_group(request: CreateGroupRequest):
+@app.post("/monitoring/groups", status_code=status.HTTP_201_CREATED, response_model=None)
+async def create_monitoring_group(payload: CreateGroupRequest, request: Request):
     """Create a new monitoring group with domains.
     
-    This endpoint creates a group and immediately performs the first dump for all domains.
+    This endpoint creates a group and immediately starts the first dump for all
+    domains in the background.
     
     Requirements: 1.1
     """
     try:
-        monitoring_service = get_monitoring_service()
+        monitoring_service = request.app.state.monitoring
         
-        domain_configs = [
-            {
-                'url': domain.url,
-                'dump_mode': domain.dump_mode,
-                'frequency_seconds': domain.frequency_seconds
-            }
-            for domain in request.domains
-        ]
+        # Serialized in one pydantic-core pass rather than field by field.
+        domain_configs = payload.model_dump()['domains']
         
-        group, domains = monitoring_service.create_group(request.name, domain_configs)
+        group, domains = await anyio.to_thread.run_sync(
+            monitoring_service.create_group, payload.name, domain_configs
+        )
         
-        return {
+        return ORJSONResponse({
             'id': group.id,
             'name': group.name,
             'created_at': group.created_at,
@@ -278,7 +476,7 @@ async def create_monitoring_group(request: CreateGroupRequest):
                 }
                 for domain in domains
             ]
-        }
+        }, status_code=status.HTTP_201_CREATED)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -287,8 +485,8 @@ async def create_monitoring_group(request: CreateGroupRequest):
             detail=f"Failed to create group: {str(e)}"
         )
 
-@app.get("/monitoring/groups")
-async def list_monitoring_groups():
+@app.get("/monitoring/groups", response_model=None)
+async def list_monitoring_groups(request: Request):
     """Get all monitoring groups.
     
     Returns a list of all groups with their names and domain counts.
@@ -296,10 +494,10 @@ async def list_monitoring_groups():
     Requirements: 6.1
     """
     try:
-        monitoring_service = get_monitoring_service()
+        monitoring_service = request.app.state.monitoring
         groups = monitoring_service.get_all_groups()
         
-        return {
+        return ORJSONResponse({
             'groups': [
                 {
                     'id': group.id,
@@ -309,15 +507,15 @@ async def list_monitoring_groups():
                 }
                 for group in groups
             ]
-        }
+        })
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve groups: {str(e)}"
         )
 
-@app.get("/monitoring/groups/{group_id}")
-async def get_monitoring_group(group_id: str):
+@app.get("/monitoring/groups/{group_id}", response_model=None)
+async def get_monitoring_group(group_id: str, request: Request):
     """Get details for a specific monitoring group.
     
     Returns group information including all domain IDs.
@@ -325,7 +523,7 @@ async def get_monitoring_group(group_id: str):
     Requirements: 6.1
     """
     try:
-        monitoring_service = get_monitoring_service()
+        monitoring_service = request.app.state.monitoring
         group = monitoring_service.get_group(group_id)
         
         if group is None:
@@ -334,13 +532,13 @@ async def get_monitoring_group(group_id: str):
                 detail=f"Group not found: {group_id}"
             )
         
-        return {
+        return ORJSONResponse({
             'id': group.id,
             'name': group.name,
             'created_at': group.created_at,
             'domain_ids': group.domain_ids,
             'domain_count': len(group.domain_ids)
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -349,8 +547,8 @@ async def get_monitoring_group(group_id: str):
             detail=f"Failed to retrieve group: {str(e)}"
         )
 
-@app.get("/monitoring/groups/{group_id}/domains")
-async def get_group_domains(group_id: str):
+@app.get("/monitoring/groups/{group_id}/domains", response_model=None)
+async def get_group_domains(group_id: str, request: Request):
     """Get all domains in a specific group.
     
     Returns detailed information about each domain in the group.
@@ -358,7 +556,7 @@ async def get_group_domains(group_id: str):
     Requirements: 6.1
     """
     try:
-        monitoring_service = get_monitoring_service()
+        monitoring_service = request.app.state.monitoring
         
         group = monitoring_service.get_group(group_id)
         if group is None:
@@ -369,7 +567,7 @@ async def get_group_domains(group_id: str):
         
         domains = monitoring_service.get_domains_in_group(group_id)
         
-        return {
+        return ORJSONResponse({
             'group_id': group_id,
             'group_name': group.name,
             'domains': [
@@ -384,7 +582,7 @@ async def get_group_domains(group_id: str):
                 }
                 for domain in domains
             ]
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -393,8 +591,8 @@ async def get_group_domains(group_id: str):
             detail=f"Failed to retrieve domains: {str(e)}"
         )
 
-@app.post("/monitoring/domains/{domain_id}/force-dump", status_code=status.HTTP_201_CREATED)
-async def force_dump_domain(domain_id: str):
+@app.post("/monitoring/domains/{domain_id}/force-dump", status_code=status.HTTP_201_CREATED, response_model=None)
+async def force_dump_domain(domain_id: str, request: Request):
     """Trigger a manual force dump for a domain.
     
     Creates an immediate snapshot regardless of the scheduled frequency.
@@ -402,18 +600,18 @@ async def force_dump_domain(domain_id: str):
     Requirements: 5.1
     """
     try:
-        monitoring_service = get_monitoring_service()
+        monitoring_service = request.app.state.monitoring
         
         snapshot = monitoring_service.trigger_force_dump(domain_id)
         
-        return {
+        return ORJSONResponse({
             'snapshot_id': snapshot.id,
             'domain_id': snapshot.domain_id,
             'timestamp': snapshot.timestamp,
             'trigger_type': snapshot.trigger_type,
             'success': snapshot.success,
             'error_message': snapshot.error_message
-        }
+        }, status_code=status.HTTP_201_CREATED)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -422,8 +620,8 @@ async def force_dump_domain(domain_id: str):
             detail=f"Failed to trigger force dump: {str(e)}"
         )
 
-@app.get("/monitoring/domains/{domain_id}/snapshots")
-async def get_domain_snapshots(domain_id: str):
+@app.get("/monitoring/domains/{domain_id}/snapshots", response_model=None)
+async def get_domain_snapshots(domain_id: str, request: Request):
     """Get all snapshots for a specific domain.
     
     Returns snapshots in chronological order (oldest to newest).
@@ -431,7 +629,7 @@ async def get_domain_snapshots(domain_id: str):
     Requirements: 7.3
     """
     try:
-        monitoring_service = get_monitoring_service()
+        monitoring_service = request.app.state.monitoring
         
         domain = monitoring_service.get_domain(domain_id)
         if domain is None:
@@ -442,7 +640,7 @@ async def get_domain_snapshots(domain_id: str):
         
         snapshots = monitoring_service.get_snapshots_for_domain(domain_id)
         
-        return {
+        return ORJSONResponse({
             'domain_id': domain_id,
             'domain_url': domain.url,
             'snapshots': [
@@ -457,7 +655,7 @@ async def get_domain_snapshots(domain_id: str):
                 }
                 for snapshot in snapshots
             ]
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -466,8 +664,8 @@ async def get_domain_snapshots(domain_id: str):
             detail=f"Failed to retrieve snapshots: {str(e)}"
         )
 
-@app.get("/monitoring/snapshots/{snapshot_id}")
-async def get_snapshot_details(snapshot_id: str):
+@app.get("/monitoring/snapshots/{snapshot_id}", response_model=None)
+async def get_snapshot_details(snapshot_id: str, request: Request):
     """Get detailed information about a specific snapshot.
     
     Returns snapshot content, domain metadata, and complete logs.
@@ -475,7 +673,7 @@ async def get_snapshot_details(snapshot_id: str):
     Requirements: 7.4, 7.5, 7.6
     """
     try:
-        monitoring_service = get_monitoring_service()
+        monitoring_service = request.app.state.monitoring
         
         details = monitoring_service.get_snapshot_details(snapshot_id)
         
@@ -488,7 +686,7 @@ async def get_snapshot_details(snapshot_id: str):
         snapshot = details['snapshot']
         domain = details['domain']
         
-        return {
+        return ORJSONResponse({
             'snapshot': {
                 'id': snapshot.id,
                 'timestamp': snapshot.timestamp,
@@ -510,28 +708,11 @@ async def get_snapshot_details(snapshot_id: str):
             'html_content': details['html_content'],
             'screenshot_exists': details['screenshot_exists'],
             'assets': details['assets'],
-            'ping_logs': [
-                {
-                    'timestamp': log.timestamp,
-                    'reachable': log.reachable,
-                    'status_code': log.status_code,
-                    'change_detected': log.change_detected,
-                    'message': log.message
-                }
-                for log in details['ping_logs']
-            ],
-            'dump_logs': [
-                {
-                    'timestamp': log.timestamp,
-                    'trigger_type': log.trigger_type,
-                    'snapshot_id': log.snapshot_id,
-                    'success': log.success,
-                    'error_message': log.error_message,
-                    'message': log.message
-                }
-                for log in details['dump_logs']
-            ]
-        }
+            # Log entries are dataclasses whose fields are exactly the wire
+            # format, so orjson serializes them natively without a copy.
+            'ping_logs': details['ping_logs'],
+            'dump_logs': details['dump_logs']
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -541,45 +722,57 @@ async def get_snapshot_details(snapshot_id: str):
         )
 
 @app.get("/monitoring/snapshots/{snapshot_id}/screenshot")
-async def get_snapshot_screenshot(snapshot_id: str):
+async def get_snapshot_screenshot(snapshot_id: str, request: Request):
     """Get the screenshot image for a specific snapshot.
     
-    Returns the screenshot file if it exists.
+    Returns the screenshot file if it exists. A snapshot's screenshot never
+    changes once written, so it is served as immutable with the snapshot ID as
+    its ETag and revalidations are answered without touching disk.
     
     Requirements: 7.4
     """
     try:
-        monitoring_service = get_monitoring_service()
+        cache_headers = {
+            "Cache-Control": "public, max-age=31536000, immutable",
+            "ETag": f'"{snapshot_id}"'
+        }
+        if_none_match = request.headers.get("if-none-match", "")
+        if cache_headers["ETag"] in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
         
-        details = monitoring_service.get_snapshot_details(snapshot_id)
+        monitoring_service = request.app.state.monitoring
         
-        if details is None:
+        snapshot = monitoring_service.get_snapshot(snapshot_id)
+        
+        if snapshot is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Snapshot not found: {snapshot_id}"
             )
         
-        snapshot = details['snapshot']
-        
-        if not snapshot.screenshot_path or not details['screenshot_exists']:
+        if not snapshot.screenshot_path:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Screenshot not available for snapshot: {snapshot_id}"
             )
         
-        storage = get_storage_manager()
+        storage = request.app.state.storage
         screenshot_path = storage.data_dir / snapshot.screenshot_path
         
-        if not screenshot_path.exists():
+        try:
+            screenshot_stat = os.stat(screenshot_path)
+        except OSError:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Screenshot file not found: {screenshot_path}"
             )
         
-        return FileResponse(
+        return LargeFileResponse(
             path=str(screenshot_path),
             media_type="image/png",
-            filename=f"snapshot_{snapshot_id}.png"
+            filename=f"snapshot_{snapshot_id}.png",
+            stat_result=screenshot_stat,
+            headers=cache_headers
         )
     except HTTPException:
         raise
@@ -589,8 +782,24 @@ async def get_snapshot_screenshot(snapshot_id: str):
             detail=f"Failed to retrieve screenshot: {str(e)}"
         )
 
-@app.post("/monitoring/reset", status_code=status.HTTP_200_OK)
-async def reset_monitoring_environment():
+def _reset_environment_sync(state) -> dict:
+    """Quiesce first dumps and checks, wipe the stored state, then resume."""
+    # First dumps are finished before the scheduler is paused and cleared: a
+    # running one still saves its domain and schedules its checks.
+    with state.monitoring.first_dumps_drained():
+        scheduler = state.scheduler
+        was_running = scheduler.scheduler is not None and scheduler.scheduler.running
+        if was_running:
+            scheduler.pause_and_clear_jobs()
+        
+        try:
+            return state.storage.reset_environment()
+        finally:
+            if was_running:
+                scheduler.resume_scheduler()
+
+@app.post("/monitoring/reset", status_code=status.HTTP_200_OK, response_model=None)
+async def reset_monitoring_environment(request: Request):
     """Reset the monitoring environment by deleting all data.
     
     This will delete:
@@ -601,25 +810,17 @@ async def reset_monitoring_environment():
     WARNING: This action cannot be undone!
     """
     try:
-        storage = get_storage_manager()
-        
-        scheduler = get_scheduler()
-        was_running = scheduler.scheduler is not None and scheduler.scheduler.running
-        if was_running:
-            scheduler.stop_scheduler()
-        
-        stats = storage.reset_environment()
-        
-        if was_running:
-            scheduler.start_scheduler()
+        # Waits for first dumps and running checks, which can take minutes,
+        # so the whole sequence runs off the event loop.
+        stats = await anyio.to_thread.run_sync(_reset_environment_sync, request.app.state)
         
         logger.info(f"Environment reset: {stats}")
         
-        return {
+        return ORJSONResponse({
             'success': True,
             'message': 'Monitoring environment has been reset',
             'statistics': stats
-        }
+        })
     except Exception as e:
         logger.error(f"Failed to reset environment: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -1,11 +1,70 @@
 """Data models for the Domain Monitoring System."""
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import List, Optional, Literal
-from datetime import datetime
+import hashlib
 import json
+import os
+import stat
+import time
 import uuid
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the most recent timestamp, so only
+# the microseconds are formatted for repeat calls within the same second.
+_iso_second: tuple = (None, '')
+
+
+def utc_now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string with a 'Z' suffix."""
+    global _iso_second
+    sec, rem_ns = divmod(time.time_ns(), 1_000_000_000)
+    cached = _iso_second
+    if cached[0] != sec:
+        cached = _iso_second = (sec, time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(sec)))
+    return f"{cached[1]}.{rem_ns // 1000:06d}Z"
+
+
+def html_digest(html: str) -> str:
+    """Return the hex SHA-256 of a page's UTF-8 encoding (Snapshot.html_sha256)."""
+    return hashlib.sha256(html.encode('utf-8')).hexdigest()
+
+
+def _stat_mode(path: str) -> Optional[int]:
+    """Return st_mode for path (following symlinks), or None if it is missing."""
+    try:
+        return os.stat(path).st_mode
+    except OSError:
+        return None
+
+
+def _fast_asdict(obj) -> dict:
+    """Shallow field -> value dict of a model dataclass.
+    
+    The models hold only scalars (and Group's list of id strings), so the
+    recursive deep copy done by ``dataclasses.asdict`` is unnecessary.
+    """
+    return {name: getattr(obj, name) for name in obj.__dataclass_fields__}
+
+
+def _to_json(obj, indent: bool) -> str:
+    """Serialize a model dataclass, natively via orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(_fast_asdict(obj), indent=2 if indent else None)
+
+
+def _from_json(json_str: str) -> dict:
+    """Parse a JSON document produced by ``_to_json``."""
+    if orjson is not None:
+        return orjson.loads(json_str)
+    return json.loads(json_str)
+
+@dataclass(slots=True)
 class Group:
     """Represents a monitoring group containing multiple domains."""
     id: str
@@ -19,13 +78,15 @@ class Group:
         return Group(
             id=str(uuid.uuid4()),
             name=name,
-            created_at=datetime.utcnow().isoformat() + 'Z',
+            created_at=utc_now_iso(),
             domain_ids=domain_ids or []
         )
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        data = _fast_asdict(self)
+        data['domain_ids'] = list(self.domain_ids)
+        return data
     
     @staticmethod
     def from_dict(data: dict) -> 'Group':
@@ -34,14 +95,14 @@ class Group:
     
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        return _to_json(self, indent=True)
     
     @staticmethod
     def from_json(json_str: str) -> 'Group':
         """Create Group from JSON string."""
-        return Group.from_dict(json.loads(json_str))
+        return Group(**_from_json(json_str))
 
-@dataclass
+@dataclass(slots=True)
 class Domain:
     """Represents a monitored domain with its configuration."""
     id: str
@@ -67,12 +128,12 @@ class Domain:
             url=url,
             dump_mode=dump_mode,
             frequency_seconds=frequency_seconds,
-            created_at=datetime.utcnow().isoformat() + 'Z'
+            created_at=utc_now_iso()
         )
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        return _fast_asdict(self)
     
     @staticmethod
     def from_dict(data: dict) -> 'Domain':
@@ -81,14 +142,14 @@ class Domain:
     
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        return _to_json(self, indent=True)
     
     @staticmethod
     def from_json(json_str: str) -> 'Domain':
         """Create Domain from JSON string."""
-        return Domain.from_dict(json.loads(json_str))
+        return Domain(**_from_json(json_str))
 
-@dataclass
+@dataclass(slots=True)
 class Snapshot:
     """Represents a captured snapshot of a domain at a specific time."""
     id: str
@@ -101,6 +162,8 @@ class Snapshot:
     asset_count: int
     success: bool
     error_message: Optional[str] = None
+    # Digest of the saved HTML; None for failed dumps and older snapshots.
+    html_sha256: Optional[str] = None
     
     @staticmethod
     def create(
@@ -117,7 +180,7 @@ class Snapshot:
         return Snapshot(
             id=str(uuid.uuid4()),
             domain_id=domain_id,
-            timestamp=datetime.utcnow().isoformat() + 'Z',
+            timestamp=utc_now_iso(),
             trigger_type=trigger_type,
             html_path=html_path,
             screenshot_path=screenshot_path,
@@ -141,34 +204,35 @@ class Snapshot:
         errors = []
         
         if self.html_path:
-            html_file = Path(data_dir) / self.html_path
-            if not html_file.exists():
+            html_mode = _stat_mode(os.path.join(data_dir, self.html_path))
+            if html_mode is None:
                 errors.append(f"HTML file does not exist: {self.html_path}")
-            elif not html_file.is_file():
+            elif not stat.S_ISREG(html_mode):
                 errors.append(f"HTML path is not a file: {self.html_path}")
         else:
             if self.success:
                 errors.append("HTML path is empty but snapshot marked as successful")
         
         if self.screenshot_path:
-            screenshot_file = Path(data_dir) / self.screenshot_path
-            if not screenshot_file.exists():
-                pass
-            elif not screenshot_file.is_file():
+            screenshot_mode = _stat_mode(os.path.join(data_dir, self.screenshot_path))
+            if screenshot_mode is not None and not stat.S_ISREG(screenshot_mode):
                 errors.append(f"Screenshot path is not a file: {self.screenshot_path}")
         
         if self.assets_dir:
-            assets_path = Path(data_dir) / self.assets_dir
-            if not assets_path.exists():
+            assets_path = os.path.join(data_dir, self.assets_dir)
+            assets_mode = _stat_mode(assets_path)
+            if assets_mode is None:
                 errors.append(f"Assets directory does not exist: {self.assets_dir}")
-            elif not assets_path.is_dir():
+            elif not stat.S_ISDIR(assets_mode):
                 errors.append(f"Assets path is not a directory: {self.assets_dir}")
             else:
-                actual_files = [f for f in assets_path.iterdir() if f.is_file()]
-                if len(actual_files) != self.asset_count:
+                # scandir's cached entry type avoids a stat per file.
+                with os.scandir(assets_path) as entries:
+                    actual_count = sum(1 for entry in entries if entry.is_file())
+                if actual_count != self.asset_count:
                     errors.append(
                         f"Asset count mismatch: metadata says {self.asset_count}, "
-                        f"but found {len(actual_files)} files"
+                        f"but found {actual_count} files"
                     )
         elif self.asset_count > 0:
             errors.append(f"Asset count is {self.asset_count} but assets_dir is None")
@@ -194,7 +258,7 @@ class Snapshot:
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        return _fast_asdict(self)
     
     @staticmethod
     def from_dict(data: dict) -> 'Snapshot':
@@ -203,14 +267,14 @@ class Snapshot:
     
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        return _to_json(self, indent=True)
     
     @staticmethod
     def from_json(json_str: str) -> 'Snapshot':
         """Create Snapshot from JSON string."""
-        return Snapshot.from_dict(json.loads(json_str))
+        return Snapshot(**_from_json(json_str))
 
-@dataclass
+@dataclass(slots=True)
 class PingLogEntry:
     """Represents a single ping log entry for domain availability checks."""
     timestamp: str
@@ -228,7 +292,7 @@ class PingLogEntry:
     ) -> 'PingLogEntry':
         """Create a new ping log entry with current timestamp."""
         return PingLogEntry(
-            timestamp=datetime.utcnow().isoformat() + 'Z',
+            timestamp=utc_now_iso(),
             reachable=reachable,
             status_code=status_code,
             change_detected=change_detected,
@@ -237,7 +301,7 @@ class PingLogEntry:
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        return _fast_asdict(self)
     
     @staticmethod
     def from_dict(data: dict) -> 'PingLogEntry':
@@ -246,14 +310,14 @@ class PingLogEntry:
     
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict())
+        return _to_json(self, indent=False)
     
     @staticmethod
     def from_json(json_str: str) -> 'PingLogEntry':
         """Create PingLogEntry from JSON string."""
-        return PingLogEntry.from_dict(json.loads(json_str))
+        return PingLogEntry(**_from_json(json_str))
 
-@dataclass
+@dataclass(slots=True)
 class DumpLogEntry:
     """Represents a single dump log entry for snapshot creation events."""
     timestamp: str
@@ -273,7 +337,7 @@ class DumpLogEntry:
     ) -> 'DumpLogEntry':
         """Create a new dump log entry with current timestamp."""
         return DumpLogEntry(
-            timestamp=datetime.utcnow().isoformat() + 'Z',
+            timestamp=utc_now_iso(),
             trigger_type=trigger_type,
             snapshot_id=snapshot_id,
             success=success,
@@ -283,7 +347,7 @@ class DumpLogEntry:
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        return _fast_asdict(self)
     
     @staticmethod
     def from_dict(data: dict) -> 'DumpLogEntry':
@@ -292,9 +356,9 @@ class DumpLogEntry:
     
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict())
+        return _to_json(self, indent=False)
     
     @staticmethod
     def from_json(json_str: str) -> 'DumpLogEntry':
         """Create DumpLogEntry from JSON string."""
-        return DumpLogEntry.from_dict(json.loads(json_str))
+        return DumpLogEntry(**_from_json(json_str))
@@ -0,0 +1,43 @@
+"""One-off Playwright screenshot, run as a subprocess by CaptureEngine.
+
+Usage: python _pw_capture.py <url> <output_path> <timeout_seconds>
+
+Exits 0 once the screenshot is written, or 1 with the error on stderr.
+"""
+import sys
+
+from playwright.sync_api import sync_playwright
+
+CHROMIUM_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu'
+]
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+
+def main(argv: list) -> int:
+    url, output_path, timeout_seconds = argv[1], argv[2], float(argv[3])
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+            
+            context = browser.new_context(
+                viewport={'width': 1920, 'height': 1080},
+                user_agent=USER_AGENT
+            )
+            
+            page = context.new_page()
+            page.goto(url, timeout=timeout_seconds * 1000, wait_until='networkidle')
+            page.wait_for_timeout(1000)
+            page.screenshot(path=output_path, full_page=True)
+            browser.close()
+        return 0
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
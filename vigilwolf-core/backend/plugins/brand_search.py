@@ -1,39 +1,104 @@
 from difflib import SequenceMatcher
+import functools
+import heapq
+import operator
+import os
 import re
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
-from .fuzzsearchfunc import fuzzy_search_with_score
-from .regexsearchfunc import regex_search_with_info
+# Each cached entry holds one row per matching domain (often most of
+# the NRD file), so only a handful of recent brands are kept.
+RANKED_MATCHES_CACHE_SIZE = 4
+# A first page up to this size is picked with heapq.nlargest instead of
+# sorting every match; later pages sort once and reuse the cached order.
+FIRST_PAGE_PARTIAL_SORT_LIMIT = 1000
+
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+# Rows are (domain, score, regex_hit): rank by score, then by regex hit.
+_RANK_KEY = operator.itemgetter(1, 2)
+
+try:
+    # An order of magnitude faster than difflib on short labels. Note that
+    # it is a different metric: rapidfuzz scores the Indel distance, while
+    # SequenceMatcher.ratio scores matching blocks, so the two disagree on
+    # many inputs ("amazon" vs "oamzna": 66 vs 50). Scores, rankings and
+    # any thresholds on them therefore depend on which one is installed.
+    from rapidfuzz.fuzz import ratio as _similarity
+except ImportError:
+    def _similarity(a: str, b: str) -> float:
+        return SequenceMatcher(None, a, b).ratio() * 100
 
 
 def brand_search(brand: str, filepath: str, limit: Optional[int] = None, offset: int = 0) -> Dict[str, Any]:
     if not brand or not isinstance(brand, str):
         return {"results": [], "total": 0}
 
-    fuzzy_results = fuzzy_search_with_score(brand, filepath)
-    regex_results = regex_search_with_info(re.escape(brand), filepath)
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return {"results": [], "total": 0}
+
+    # Both matchers are case-insensitive, so the lowered brand is a safe key;
+    # mtime/size make a rewritten NRD file miss the cache.
+    matches = _brand_matches(brand.lower(), filepath, st.st_mtime_ns, st.st_size)
 
-    fuzzy_map = {r['domain']: r['score'] for r in fuzzy_results}
-    regex_set = {r['domain'] for r in regex_results}
+    total = len(matches['rows'])
+    ranked = matches['ranked']
+    if ranked is None and offset == 0 and limit is not None and 0 <= limit <= FIRST_PAGE_PARTIAL_SORT_LIMIT:
+        # nlargest is stable, so this matches the head of the full ranking.
+        sliced = heapq.nlargest(limit, matches['rows'], key=_RANK_KEY)
+    else:
+        if ranked is None:
+            ranked = matches['ranked'] = tuple(sorted(matches['rows'], key=_RANK_KEY, reverse=True))
+        if limit is None:
+            sliced = ranked[offset:]
+        else:
+            sliced = ranked[offset: offset + limit]
 
-    combined = set()
-    combined.update(fuzzy_map.keys())
-    combined.update(regex_set)
+    results = [
+        {'domain': domain, 'fuzzyScore': score, 'regexHit': regex_hit}
+        for domain, score, regex_hit in sliced
+    ]
+    return {"results": results, "total": total}
 
-    results = []
-    for domain in combined:
-        results.append({
-            'domain': domain,
-            'fuzzyScore': fuzzy_map.get(domain, 0),
-            'regexHit': domain in regex_set,
-        })
 
-    results.sort(key=lambda r: (r['fuzzyScore'], r['regexHit']), reverse=True)
+@functools.lru_cache(maxsize=RANKED_MATCHES_CACHE_SIZE)
+def _brand_matches(brand: str, filepath: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Matching rows in file order, plus their full ranking once it is needed."""
+    return {'rows': tuple(_scan_brand_matches(brand, filepath).values()), 'ranked': None}
 
-    total = len(results)
-    if limit is None:
-        sliced = results[offset:]
-    else:
-        sliced = results[offset: offset + limit]
 
-    return {"results": sliced, "total": total}
+@functools.lru_cache(maxsize=1024)
+def _compile_brand(brand: str) -> re.Pattern:
+    """Case-insensitive literal pattern for a (lowercased) brand."""
+    return re.compile(re.escape(brand), re.IGNORECASE)
+
+
+def _scan_brand_matches(brand: str, filepath: str) -> Dict[str, Tuple[str, int, bool]]:
+    """Score every domain against the brand in a single pass over the file.
+
+    Computes the same fuzzy score as ``fuzzy_search_with_score`` and the same
+    hit as ``regex_search_with_info`` on the escaped brand, keeping domains
+    where either matched. Values are the final (domain, score, regex_hit)
+    rows, so ranking needs no second merge pass.
+    """
+    brand_norm = _NON_ALNUM_RE.sub('', brand.lower())
+    brand_re = _compile_brand(brand)
+    matches: Dict[str, Tuple[str, int, bool]] = {}
+
+    try:
+        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line in matches:
+                    continue
+
+                label_norm = _NON_ALNUM_RE.sub('', line.lower().split('.')[0])
+                score = int(_similarity(brand_norm, label_norm))
+                regex_hit = brand_re.search(line) is not None
+                if score > 0 or regex_hit:
+                    matches[line] = (line, score, regex_hit)
+    except FileNotFoundError:
+        pass
+
+    return matches
@@ -2,26 +2,87 @@
 
 Handles:
 - HTML fetching from URLs
-- HTML comparison for change detection
 - Screenshot capture using Playwright
 - Asset extraction and downloading
 """
 import os
+import sys
 import hashlib
+import logging
+import queue
 import requests
+import subprocess
+import threading
 import time
+from http.cookiejar import DefaultCookiePolicy
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from requests.adapters import HTTPAdapter
 from typing import Tuple, List, Optional
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
+
+try:
+    import lxml.html as lxml_html
+except ImportError:
+    lxml_html = None
+
+try:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from selenium.common.exceptions import WebDriverException, TimeoutException
+    SELENIUM_AVAILABLE = True
+except ImportError:
+    SELENIUM_AVAILABLE = False
 from config import (
     DEFAULT_TIMEOUT_SECONDS, 
     SCREENSHOT_ENABLED,
+    MAX_CONCURRENT_CHECKS,
     MAX_RETRIES,
     RETRY_DELAY_SECONDS,
     RETRY_BACKOFF_MULTIPLIER
 )
 
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+# Parallel downloads per snapshot; assets are network-bound.
+ASSET_DOWNLOAD_WORKERS = 16
+ASSET_CHUNK_SIZE = 64 * 1024
+CHROMIUM_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu'
+]
+
+
+PLAYWRIGHT_CAPTURE_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_pw_capture.py')
+# Asset files are created and removed relative to an open assets-directory
+# descriptor where the platform supports it (not on Windows).
+ASSET_DIR_FD_SUPPORTED = (
+    hasattr(os, 'O_DIRECTORY')
+    and os.open in os.supports_dir_fd
+    and os.unlink in os.supports_dir_fd
+)
+
+
+class BrowserUnavailableError(Exception):
+    """Raised when no persistent Playwright browser can take a capture."""
+
+
+class _BrowserWorker:
+    """A thread owning its own Playwright instance and persistent Chromium.
+    
+    Playwright's sync API is bound to the thread that started it, so each
+    worker's browser is only ever touched through its single-thread executor.
+    """
+    
+    def __init__(self, index: int):
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"playwright-{index}")
+        self.playwright = None
+        self.browser = None
+
+
 class CaptureEngine:
     """Handles all capture operations for domain monitoring."""
     
@@ -33,8 +94,28 @@ class CaptureEngine:
         """
         self.timeout = timeout
         self.screenshot_enabled = SCREENSHOT_ENABLED
-        self._playwright = None
-        self._browser = None
+        self._browser_workers: Optional[List[_BrowserWorker]] = None
+        self._idle_browser_workers: "queue.Queue[_BrowserWorker]" = queue.Queue()
+        self._browser_lock = threading.Lock()
+        self._session = self._create_session()
+    
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create the pooled HTTP session shared by page and asset fetches.
+        
+        Keep-alive connections are reused across requests to the same host, so
+        a page and its assets pay for one TCP/TLS handshake instead of one each.
+        Retries stay in the fetch loops, so the adapter itself never retries.
+        Only connections are shared: the cookie jar accepts nothing, so a
+        Set-Cookie from one check cannot change the HTML served to the next.
+        """
+        session = requests.Session()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({'User-Agent': USER_AGENT})
+        return session
     
     def fetch_html(self, url: str, max_retries: int = MAX_RETRIES) -> Tuple[str, bool]:
         """Fetch HTML content from a URL with retry logic for transient failures.
@@ -48,16 +129,12 @@ class CaptureEngine:
             - html_content: The HTML string (empty if failed)
             - success: True if fetch succeeded, False otherwise
         """
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
         last_exception = None
         retry_delay = RETRY_DELAY_SECONDS
         
         for attempt in range(max_retries):
             try:
-                response = requests.get(url, timeout=self.timeout, headers=headers)
+                response = self._session.get(url, timeout=self.timeout)
                 response.raise_for_status()
                 return response.text, True
             except requests.exceptions.Timeout as e:
@@ -86,23 +163,6 @@ class CaptureEngine:
         
         return "", False
 
-    def compare_html(self, html1: str, html2: str) -> bool:
-        """Compare two HTML strings to detect changes.
-        
-        Uses normalized comparison to ignore insignificant whitespace differences.
-        
-        Args:
-            html1: First HTML string
-            html2: Second HTML string
-            
-        Returns:
-            True if HTML is different, False if identical
-        """
-        hash1 = hashlib.sha256(html1.encode('utf-8')).hexdigest()
-        hash2 = hashlib.sha256(html2.encode('utf-8')).hexdigest()
-        
-        return hash1 != hash2
-    
     def capture_screenshot(self, url: str, output_path: str, max_retries: int = MAX_RETRIES) -> bool:
         """Capture a screenshot of a webpage with retry logic and fallback methods.
         
@@ -119,11 +179,9 @@ class CaptureEngine:
             True if screenshot captured successfully, False otherwise
         """
         if not self.screenshot_enabled:
-            import logging
             logging.info("Screenshot capture is disabled in configuration")
             return False
         
-        import logging
         logger = logging.getLogger(__name__)
         
         logger.info(f"Attempting screenshot capture for {url} using Playwright")
@@ -146,6 +204,11 @@ class CaptureEngine:
     def _capture_with_playwright(self, url: str, output_path: str, max_retries: int, logger) -> bool:
         """Capture screenshot using Playwright.
         
+        Captures run on one of MAX_CONCURRENT_CHECKS long-lived Chromium
+        instances, each owned by its own thread, with a fresh browser context
+        per capture. If every browser is busy or one cannot be started, the
+        attempt falls back to a one-off Playwright subprocess.
+        
         Args:
             url: URL to capture
             output_path: Path where screenshot should be saved
@@ -155,68 +218,25 @@ class CaptureEngine:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            # Use subprocess to run playwright in a separate process to avoid async issues
-            import subprocess
-            import json
-        except ImportError:
-            logger.warning("Required modules not available")
-            return False
-        
         retry_delay = RETRY_DELAY_SECONDS
         
         for attempt in range(max_retries):
             try:
                 logger.info(f"Playwright attempt {attempt + 1}/{max_retries}")
                 
-                # Create a simple Python script to run Playwright
-                script = f"""
-import sys
-from playwright.sync_api import sync_playwright
-
-try:
-    with sync_playwright() as p:
-        browser = p.chromium.launch(
-            headless=True,
-            args=[
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-gpu'
-            ]
-        )
-        
-        context = browser.new_context(
-            viewport={{'width': 1920, 'height': 1080}},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        )
-        
-        page = context.new_page()
-        page.goto('{url}', timeout={self.timeout * 1000}, wait_until='networkidle')
-        page.wait_for_timeout(1000)
-        page.screenshot(path='{output_path}', full_page=True)
-        browser.close()
-        sys.exit(0)
-except Exception as e:
-    print(f"Error: {{e}}", file=sys.stderr)
-    sys.exit(1)
-"""
+                try:
+                    self._capture_on_browser_worker(url, output_path)
+                except BrowserUnavailableError as e:
+                    logger.warning(f"Persistent Playwright browser unavailable ({e}), using a subprocess")
+                    self._capture_with_playwright_subprocess(url, output_path)
                 
-                # Run the script in a subprocess
-                result = subprocess.run(
-                    ['python', '-c', script],
-                    capture_output=True,
-                    text=True,
-                    timeout=self.timeout + 10
-                )
-                
-                if result.returncode == 0 and os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+                if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
                     logger.info(f"Screenshot file created: {os.path.getsize(output_path)} bytes")
                     return True
                 else:
-                    logger.warning(f"Playwright failed: {result.stderr}")
+                    logger.warning("Playwright finished without writing a screenshot")
                     
-            except subprocess.TimeoutExpired:
+            except (FutureTimeoutError, subprocess.TimeoutExpired):
                 logger.warning(f"Playwright timeout on attempt {attempt + 1}")
                 if attempt < max_retries - 1:
                     time.sleep(retry_delay)
@@ -232,6 +252,123 @@ except Exception as e:
         
         return False
     
+    def _capture_on_browser_worker(self, url: str, output_path: str) -> None:
+        """Screenshot url on an idle persistent browser.
+        
+        The capture starts as soon as it is handed over, so the timeout covers
+        the capture itself rather than time spent queued behind others.
+        
+        Raises:
+            BrowserUnavailableError: If every worker is busy, or the worker's
+                browser cannot be started
+            concurrent.futures.TimeoutError: If the capture outlives its timeout
+        """
+        idle = self._idle_browser_workers_queue()
+        try:
+            worker = idle.get_nowait()
+        except queue.Empty:
+            raise BrowserUnavailableError("all persistent browsers are busy")
+        
+        future = worker.executor.submit(self._screenshot_with_browser, worker, url, output_path)
+        # The worker is only handed out again once its job has really ended, so
+        # a timed-out capture never gets another one queued behind it.
+        future.add_done_callback(lambda _: idle.put(worker))
+        try:
+            future.result(timeout=self.timeout + 10)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+    
+    def _idle_browser_workers_queue(self) -> "queue.Queue[_BrowserWorker]":
+        """Return the idle-worker queue, creating the browser workers on first use.
+        
+        There is one worker per concurrent check, so checks capture in parallel.
+        """
+        with self._browser_lock:
+            if self._browser_workers is None:
+                self._browser_workers = [_BrowserWorker(i) for i in range(MAX_CONCURRENT_CHECKS)]
+                for worker in self._browser_workers:
+                    self._idle_browser_workers.put(worker)
+            return self._idle_browser_workers
+    
+    def _ensure_browser(self, worker: _BrowserWorker):
+        """Start the worker's Chromium on first use, or again if it has disconnected.
+        
+        Runs on the worker's thread.
+        
+        Raises:
+            BrowserUnavailableError: If Playwright or Chromium cannot be started
+        """
+        if worker.browser is not None and worker.browser.is_connected():
+            return worker.browser
+        
+        self._close_browser(worker)
+        try:
+            from playwright.sync_api import sync_playwright
+            worker.playwright = sync_playwright().start()
+            worker.browser = worker.playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        except Exception as e:
+            self._close_browser(worker)
+            raise BrowserUnavailableError(str(e)) from e
+        return worker.browser
+    
+    def _screenshot_with_browser(self, worker: _BrowserWorker, url: str, output_path: str) -> None:
+        """Screenshot a page in an isolated context of the worker's browser.
+        
+        Runs on the worker's thread.
+        """
+        browser = self._ensure_browser(worker)
+        context = browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent=USER_AGENT
+        )
+        try:
+            page = context.new_page()
+            page.goto(url, timeout=self.timeout * 1000, wait_until='networkidle')
+            page.wait_for_timeout(1000)
+            page.screenshot(path=output_path, full_page=True)
+        finally:
+            context.close()
+    
+    @staticmethod
+    def _close_browser(worker: _BrowserWorker) -> None:
+        """Close the worker's browser and stop its Playwright. Runs on the worker's thread."""
+        if worker.browser is not None:
+            try:
+                worker.browser.close()
+            except Exception:
+                pass
+            worker.browser = None
+        if worker.playwright is not None:
+            try:
+                worker.playwright.stop()
+            except Exception:
+                pass
+            worker.playwright = None
+    
+    def _capture_with_playwright_subprocess(self, url: str, output_path: str) -> None:
+        """Capture a screenshot with a one-off Playwright process.
+        
+        Raises:
+            subprocess.TimeoutExpired: If the process outlives its timeout
+            RuntimeError: If the process exits with an error
+        """
+        # Use subprocess to run playwright in a separate process to avoid async issues
+        # The script is a static file and the page is passed as arguments, so
+        # nothing from the URL or path is ever interpreted as Python source.
+        # sys.executable is an absolute path, which together with
+        # close_fds=False lets CPython launch the child via posix_spawn.
+        result = subprocess.run(
+            [sys.executable, PLAYWRIGHT_CAPTURE_SCRIPT, url, output_path, str(self.timeout)],
+            capture_output=True,
+            text=True,
+            timeout=self.timeout + 10,
+            close_fds=False
+        )
+        
+        if result.returncode != 0:
+            raise RuntimeError(f"Playwright failed: {result.stderr}")
+    
     def _capture_with_selenium(self, url: str, output_path: str, max_retries: int, logger) -> bool:
         """Capture screenshot using Selenium as fallback.
         
@@ -244,11 +381,7 @@ except Exception as e:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            from selenium import webdriver
-            from selenium.webdriver.chrome.options import Options
-            from selenium.common.exceptions import WebDriverException, TimeoutException
-        except ImportError:
+        if not SELENIUM_AVAILABLE:
             logger.warning("Selenium not installed, skipping")
             return False
         
@@ -269,7 +402,6 @@ except Exception as e:
                 chrome_options.binary_location = '/usr/bin/chromium'
                 
                 logger.info("Initializing Chrome driver")
-                from selenium.webdriver.chrome.service import Service
                 service = Service('/usr/bin/chromedriver')
                 driver = webdriver.Chrome(service=service, options=chrome_options)
                 driver.set_page_load_timeout(self.timeout)
@@ -332,30 +464,14 @@ except Exception as e:
             List of absolute asset URLs
         """
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            asset_urls = []
-            
-            for link in soup.find_all('link', rel='stylesheet'):
-                href = link.get('href')
-                if href:
-                    asset_urls.append(urljoin(base_url, href))
-            
-            for script in soup.find_all('script', src=True):
-                src = script.get('src')
-                if src:
-                    asset_urls.append(urljoin(base_url, src))
-            
-            for img in soup.find_all('img', src=True):
-                src = img.get('src')
-                if src:
-                    asset_urls.append(urljoin(base_url, src))
-            
-            for link in soup.find_all('link'):
-                href = link.get('href')
-                if href and ('font' in href.lower() or link.get('type') == 'font/woff2'):
-                    asset_urls.append(urljoin(base_url, href))
-            
-            return asset_urls
+            refs = _asset_refs_lxml(html) if lxml_html is not None else None
+        except Exception:
+            refs = None
+        
+        try:
+            if refs is None:
+                refs = _asset_refs_bs4(html)
+            return [urljoin(base_url, ref) for ref in refs]
         except Exception:
             return []
     
@@ -373,59 +489,173 @@ except Exception as e:
         Returns:
             List of successfully downloaded asset filenames
         """
-        asset_urls = self.extract_asset_urls(html, base_url)
-        downloaded = []
+        return self.download_assets_from_urls(self.extract_asset_urls(html, base_url), output_dir)
+    
+    def download_assets_from_urls(self, asset_urls: List[str], output_dir: str) -> List[str]:
+        """Download already-extracted asset URLs with error isolation.
         
+        Lets a caller that has parsed the page once reuse its URL list instead
+        of having the HTML parsed again.
+        
+        Args:
+            asset_urls: Absolute asset URLs, e.g. from extract_asset_urls
+            output_dir: Directory where assets should be saved
+            
+        Returns:
+            List of successfully downloaded asset filenames
+        """
         assets_dir = Path(output_dir) / "assets"
         assets_dir.mkdir(parents=True, exist_ok=True)
-        
+        # Every asset lands in the same directory, so resolve it once and
+        # create the files relative to it instead of re-walking the full path.
+        dir_fd = os.open(assets_dir, os.O_RDONLY | os.O_DIRECTORY) if ASSET_DIR_FD_SUPPORTED else None
+        try:
+            return self._download_into(asset_urls, assets_dir, dir_fd)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+    
+    def _download_into(self, asset_urls: List[str], assets_dir: Path, dir_fd: Optional[int]) -> List[str]:
+        """Download asset_urls into assets_dir (open as dir_fd, if not None)."""
+        # One download per target file: URLs sharing a basename used to
+        # overwrite each other in order, so the last one wins here too, and no
+        # two workers ever write the same path.
+        targets = {}
         for url in asset_urls:
-            try:
-                retry_delay = RETRY_DELAY_SECONDS
-                success = False
-                
-                for attempt in range(MAX_RETRIES):
-                    try:
-                        response = requests.get(url, timeout=self.timeout)
-                        response.raise_for_status()
-                        success = True
-                        break
-                    except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
-                        if attempt < MAX_RETRIES - 1:
-                            time.sleep(retry_delay)
-                            retry_delay *= RETRY_BACKOFF_MULTIPLIER
-                        continue
-                    except Exception:
-                        break
-                
-                if not success:
-                    continue
-                
-                parsed = urlparse(url)
-                filename = os.path.basename(parsed.path)
-                
-                if not filename:
-                    filename = hashlib.md5(url.encode()).hexdigest()
-                
-                asset_path = assets_dir / filename
-                with open(asset_path, 'wb') as f:
-                    f.write(response.content)
-                
-                downloaded.append(filename)
-            except Exception:
-                continue
+            filename = self._asset_filename(url)
+            targets.pop(filename, None)
+            targets[filename] = url
+        
+        if len(targets) <= 1:
+            results = [self._download_asset(url, assets_dir / filename, dir_fd) for filename, url in targets.items()]
+        else:
+            workers = min(ASSET_DOWNLOAD_WORKERS, len(targets))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asset-download") as pool:
+                results = list(pool.map(
+                    lambda item: self._download_asset(item[1], assets_dir / item[0], dir_fd),
+                    targets.items()
+                ))
+        
+        return [filename for filename, ok in zip(targets, results) if ok]
+    
+    @staticmethod
+    def _asset_filename(url: str) -> str:
+        """Name an asset after its URL path, or a hash of the URL if it has none."""
+        filename = os.path.basename(urlparse(url).path)
+        if not filename:
+            filename = hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()
+        return filename
+    
+    def _download_asset(self, url: str, asset_path: Path, dir_fd: Optional[int] = None) -> bool:
+        """Download one asset, retrying transient network errors.
         
-        return downloaded
+        Args:
+            url: Absolute asset URL
+            asset_path: File the asset is written to
+            dir_fd: Open descriptor of asset_path's directory; when given,
+                the file is created and removed by name relative to it
+            
+        Returns:
+            True if the asset was saved, False otherwise
+        """
+        try:
+            retry_delay = RETRY_DELAY_SECONDS
+            response = None
+            
+            for attempt in range(MAX_RETRIES):
+                try:
+                    response = self._session.get(url, timeout=self.timeout, stream=True)
+                    response.raise_for_status()
+                    break
+                except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+                    response = None
+                    if attempt < MAX_RETRIES - 1:
+                        time.sleep(retry_delay)
+                        retry_delay *= RETRY_BACKOFF_MULTIPLIER
+                    continue
+                except Exception:
+                    # Release the pooled connection held by the unread body.
+                    if response is not None:
+                        response.close()
+                    response = None
+                    break
+            
+            if response is None:
+                return False
+            
+            # Streamed in chunks so only one buffer per download is resident,
+            # whatever the asset size; iter_content still undoes gzip/deflate.
+            if dir_fd is None:
+                target = open(asset_path, 'wb')
+            else:
+                target = open(asset_path.name, 'wb', opener=lambda name, flags: os.open(name, flags, 0o666, dir_fd=dir_fd))
+            with response, target as f:
+                for chunk in response.iter_content(chunk_size=ASSET_CHUNK_SIZE):
+                    f.write(chunk)
+            
+            return True
+        except Exception:
+            try:
+                if dir_fd is None:
+                    asset_path.unlink(missing_ok=True)
+                else:
+                    os.unlink(asset_path.name, dir_fd=dir_fd)
+            except OSError:
+                pass
+            return False
     
     def cleanup(self) -> None:
-        """Cleanup resources (browser instances, etc.)."""
-        if self._browser:
+        """Cleanup resources (browser instances, HTTP connections, etc.)."""
+        self._session.close()
+        with self._browser_lock:
+            workers, self._browser_workers = self._browser_workers or [], None
+            self._idle_browser_workers = queue.Queue()
+        closing = [worker.executor.submit(self._close_browser, worker) for worker in workers]
+        for worker, future in zip(workers, closing):
             try:
-                self._browser.close()
+                future.result(timeout=self.timeout + 10)
             except Exception:
                 pass
-            self._browser = None
-        self._playwright = None
+            worker.executor.shutdown(wait=False)
+
+def _collect_asset_refs(elements) -> List[str]:
+    """Collect raw asset references from (tag, attributes) pairs in one pass.
+    
+    References are grouped in the order stylesheets, scripts, images, fonts,
+    the same order the per-kind lookups used to produce them in.
+    """
+    stylesheets, scripts, images, fonts = [], [], [], []
+    for tag, attrs in elements:
+        if tag == 'link':
+            href = attrs.get('href')
+            if not href:
+                continue
+            rel = attrs.get('rel') or ()
+            if isinstance(rel, str):
+                rel = rel.split()
+            if 'stylesheet' in rel:
+                stylesheets.append(href)
+            if 'font' in href.lower() or attrs.get('type') == 'font/woff2':
+                fonts.append(href)
+        elif tag == 'script':
+            src = attrs.get('src')
+            if src:
+                scripts.append(src)
+        elif tag == 'img':
+            src = attrs.get('src')
+            if src:
+                images.append(src)
+    return stylesheets + scripts + images + fonts
+
+def _asset_refs_lxml(html: str) -> List[str]:
+    """Parse with libxml2 and walk only link/script/img elements."""
+    root = lxml_html.document_fromstring(html)
+    return _collect_asset_refs((el.tag, el.attrib) for el in root.iter('link', 'script', 'img'))
+
+def _asset_refs_bs4(html: str) -> List[str]:
+    """Pure-Python fallback for when lxml is missing or rejects the document."""
+    soup = BeautifulSoup(html, 'html.parser')
+    return _collect_asset_refs((el.name, el.attrs) for el in soup.find_all(['link', 'script', 'img']))
 
 _capture_engine = None
 
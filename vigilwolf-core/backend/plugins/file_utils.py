@@ -1,78 +1,158 @@
+import logging
+import mmap
 import os
+import re
+
+logger = logging.getLogger(__name__)
+
+# Get the backend directory (where the script runs from)
+# In Docker, this will be /app
+_BACKEND_DIR = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+# ONLY check nrd-file-dump directory for timestamped files
+# This is where nrd-fix-portable.sh saves the final timestamped files
+_NRD_DUMP_DIR = os.path.join(_BACKEND_DIR, 'nrd-file-dump')
+
+# Latest NRD file, keyed on the mtime of nrd-file-dump. Adding, removing or
+# renaming a dump updates the directory mtime, so a matching mtime means the
+# previous scan result is still valid. The (dir_mtime_ns, path) pair is
+# replaced in one assignment so readers never pair a new mtime with an old path.
+_latest_nrd_cache = {'entry': (None, '')}
+
+# Parsed lines of the most recently read domain file, keyed on
+# (path, mtime_ns, size) so a rewritten file is read again. The pair is
+# replaced in one assignment so worker threads never see a torn entry.
+_domains_cache = {'entry': (None, ())}
+
+
+def clear_nrd_cache() -> None:
+    """Forget the cached latest NRD path and parsed domain list."""
+    _latest_nrd_cache['entry'] = (None, '')
+    _domains_cache['entry'] = (None, ())
 
 
 def find_latest_nrd_file() -> str:
-    import logging
-    logger = logging.getLogger(__name__)
+    try:
+        dir_mtime_ns = os.stat(_NRD_DUMP_DIR).st_mtime_ns
+    except OSError:
+        dir_mtime_ns = None
     
-    candidates = []
+    cached_mtime_ns, cached_path = _latest_nrd_cache['entry']
+    if dir_mtime_ns is not None and dir_mtime_ns == cached_mtime_ns:
+        return cached_path
     
-    # Get the backend directory (where the script runs from)
-    # In Docker, this will be /app
-    backend_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
-    logger.info(f"Searching for NRD files in backend_dir: {backend_dir}")
+    latest_path = _scan_latest_nrd_file(_BACKEND_DIR, _NRD_DUMP_DIR)
+    _latest_nrd_cache['entry'] = (dir_mtime_ns, latest_path)
+    return latest_path
+
+
+def _scan_latest_nrd_file(backend_dir: str, nrd_dump: str) -> str:
+    logger.info("Searching for NRD files in backend_dir: %s", backend_dir)
     
-    # ONLY check nrd-file-dump directory for timestamped files
-    # This is where nrd-fix-portable.sh saves the final timestamped files
-    nrd_dump = os.path.join(backend_dir, 'nrd-file-dump')
-    if os.path.isdir(nrd_dump):
-        logger.info(f"Checking nrd-file-dump directory: {nrd_dump}")
-        for entry in os.listdir(nrd_dump):
-            # Only consider files that match the pattern: nrd-YYYY-MM-DD_HH-MM-SS.txt
-            if entry.startswith('nrd-') and entry.endswith('.txt') and '_' in entry:
-                candidate = os.path.join(nrd_dump, entry)
-                if os.path.isfile(candidate):
-                    candidates.append(candidate)
-                    logger.info(f"Found timestamped NRD file: {entry}")
-    else:
-        logger.warning(f"nrd-file-dump directory does not exist: {nrd_dump}")
+    # One scandir pass: the entry type comes from readdir, and the mtime
+    # comparison is folded in so each candidate is stat'ed once.
+    latest_path = ''
+    latest_mtime = 0
+    try:
+        with os.scandir(nrd_dump) as entries:
+            logger.info("Checking nrd-file-dump directory: %s", nrd_dump)
+            for entry in entries:
+                name = entry.name
+                # Only consider files that match the pattern: nrd-YYYY-MM-DD_HH-MM-SS.txt
+                if not (name.startswith('nrd-') and name.endswith('.txt') and '_' in name):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    m = entry.stat().st_mtime
+                except OSError as e:
+                    logger.warning("Error checking %s: %s", entry.path, e)
+                    continue
+                logger.debug("Candidate: %s, mtime: %s", name, m)
+                if m > latest_mtime:
+                    latest_mtime = m
+                    latest_path = entry.path
+    except OSError:
+        logger.warning("nrd-file-dump directory does not exist: %s", nrd_dump)
     
-    if not candidates:
+    if not latest_path:
         logger.warning("No timestamped NRD files found in nrd-file-dump")
         return ''
     
-    # Find the most recently modified file (should be the latest dump)
-    latest_path = ''
-    latest_mtime = 0
-    for c in candidates:
-        try:
-            m = os.path.getmtime(c)
-            logger.info(f"Candidate: {os.path.basename(c)}, mtime: {m}")
-            if m > latest_mtime:
-                latest_mtime = m
-                latest_path = c
-        except Exception as e:
-            logger.warning(f"Error checking {c}: {e}")
-            continue
-    
-    logger.info(f"Selected latest NRD file: {os.path.basename(latest_path) if latest_path else 'None'}")
+    logger.info("Selected latest NRD file: %s", os.path.basename(latest_path))
     return latest_path
 
 
+def _read_file_text(filepath: str) -> str:
+    """Whole file decoded as UTF-8, straight from a sequential read-only mmap.
+    
+    The decoder reads the mapped pages directly, so no intermediate bytes
+    copy of the file is made.
+    """
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        try:
+            mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped.
+            return ''
+    finally:
+        os.close(fd)
+    try:
+        if hasattr(mm, 'madvise'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        return str(mm, 'utf-8', 'ignore')
+    finally:
+        mm.close()
+
+
+def _cached_domain_lines(filepath: str) -> tuple:
+    """Stripped non-empty lines of filepath, reused while the file is unchanged."""
+    st = os.stat(filepath)
+    key = (filepath, st.st_mtime_ns, st.st_size)
+    cached_key, cached_lines = _domains_cache['entry']
+    if cached_key == key:
+        return cached_lines
+    text = _read_file_text(filepath)
+    # split/strip/filter all run in C rather than a per-line Python loop.
+    lines = tuple(filter(None, map(str.strip, text.split('\n'))))
+    _domains_cache['entry'] = (key, lines)
+    return lines
+
+
+def iter_domains_from_file(filepath: str):
+    """Yield the stripped non-empty lines of filepath one at a time.
+
+    Serves the memoized lines when they match the file's current version;
+    otherwise the file is streamed without building (or caching) a list, for
+    one-off scans that only need a single pass.
+    """
+    st = os.stat(filepath)
+    cached_key, cached_lines = _domains_cache['entry']
+    if cached_key == (filepath, st.st_mtime_ns, st.st_size):
+        yield from cached_lines
+        return
+    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+        yield from filter(None, map(str.strip, f))
+
+
 def read_domains_from_file(filepath: str) -> list:
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = [l.strip() for l in f if l.strip()]
-        return lines
+        return list(_cached_domain_lines(filepath))
     except Exception:
         return []
 
 
 def read_domains_from_file_slice(filepath: str, offset: int = 0, limit: int | None = None) -> tuple:
-    results = []
-    total = 0
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                if total >= offset and (limit is None or len(results) < limit):
-                    results.append(line)
-                total += 1
-        return results, total
+        lines = _cached_domain_lines(filepath)
     except Exception:
         return [], 0
+    # Clamped like the old line-by-line reader: a negative offset starts at
+    # the first line and a negative limit selects nothing, rather than
+    # slicing from the end of the list.
+    offset = max(offset, 0)
+    stop = None if limit is None else offset + max(limit, 0)
+    return list(lines[offset:stop]), len(lines)
 
 
 def get_latest_nrd_domains(limit: int | None = None, offset: int = 0) -> tuple:
@@ -86,3 +166,30 @@ def get_latest_nrd_domains(limit: int | None = None, offset: int = 0) -> tuple:
     else:
         domains_slice, total = read_domains_from_file_slice(path, offset=offset, limit=limit)
         return (filename, domains_slice, total)
+
+
+# A line holds a domain when its first non-whitespace byte is not '#'.
+_DOMAIN_LINE_RE = re.compile(rb'(?m)^[ \t\r\f\v]*[^\s#]')
+_COUNT_CHUNK_SIZE = 1 << 20
+
+
+def count_domains_in_file(filepath: str) -> int:
+    """Count non-empty, non-comment lines without decoding the file.
+
+    The file is scanned in 1 MiB binary chunks; any partial last line is
+    carried into the next chunk so matches never straddle a boundary.
+    """
+    count = 0
+    carry = b''
+    with open(filepath, 'rb') as f:
+        while True:
+            chunk = f.read(_COUNT_CHUNK_SIZE)
+            if not chunk:
+                break
+            data = carry + chunk if carry else chunk
+            cut = data.rfind(b'\n') + 1
+            count += len(_DOMAIN_LINE_RE.findall(data, 0, cut))
+            carry = data[cut:]
+    if carry:
+        count += len(_DOMAIN_LINE_RE.findall(carry))
+    return count
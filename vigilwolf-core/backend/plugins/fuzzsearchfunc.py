@@ -1,37 +1,89 @@
+from difflib import SequenceMatcher
+import operator
 import re
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = process = None
+
+from .file_utils import iter_domains_from_file
+
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+_SCORE_KEY = operator.itemgetter('score')
+# process.extract yields (choice, score, index) triples.
+_CHOICE_INDEX = operator.itemgetter(2)
+
+# bytes.translate tables for ASCII label normalization: uppercase maps to
+# lowercase, and everything but letters, digits, '.' and '\n' is deleted.
+_LOWER_TABLE = bytes(c + 32 if 65 <= c <= 90 else c for c in range(256))
+_NON_LABEL_BYTES = bytes(
+    c for c in range(256)
+    if not (48 <= c <= 57 or 65 <= c <= 90 or 97 <= c <= 122 or c in (10, 46))
+)
+
 
 def fuzzy_search_with_score(pattern: str, filepath: str) -> list:
-    try:
-        from difflib import SequenceMatcher
-    except ImportError:
-        return []
+    pattern_norm = _NON_ALNUM_RE.sub('', pattern.lower()).encode('ascii')
+    domains, labels = _read_domains_and_labels(filepath)
 
-    pattern_norm = re.sub(r'[^a-z0-9]', '', pattern.lower())
-    results = []
+    if process is not None:
+        # One C++ pass scores every label; a cutoff of 1 drops exactly the
+        # labels whose truncated score would be 0. fuzz.ratio is
+        # Indel-distance based and often scores differently from the difflib
+        # fallback's SequenceMatcher.ratio, so scores and ranking depend on
+        # whether rapidfuzz is installed.
+        scored = process.extract(pattern_norm, labels, scorer=fuzz.ratio, score_cutoff=1, limit=None)
+        # Back to file order so the stable sort on the truncated score breaks
+        # ties by file order, as the difflib path does.
+        scored.sort(key=_CHOICE_INDEX)
+        results = [{'domain': domains[idx], 'score': int(score)} for _, score, idx in scored]
+    else:
+        results = []
+        for domain, label_norm in zip(domains, labels):
+            score = int(SequenceMatcher(None, pattern_norm, label_norm).ratio() * 100)
+            if score > 0:
+                results.append({'domain': domain, 'score': score})
+
+    results.sort(key=_SCORE_KEY, reverse=True)
+    return results
 
-    try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-
-                label = line.lower().split('.')[0]
-                label_norm = re.sub(r'[^a-z0-9]', '', label)
-
-                try:
-                    score = int(SequenceMatcher(None, pattern_norm, label_norm).ratio() * 100)
-                    if score > 0:
-                        results.append({'domain': line, 'score': score})
-                except Exception:
-                    pass
 
+def _read_domains_and_labels(filepath: str) -> tuple:
+    """Stripped non-empty lines and their normalized first labels (as bytes).
+
+    Labels are computed for the whole file with one translate over the joined
+    buffer, so the per-line work is a single partition. Lines holding
+    non-ASCII bytes, whose str.lower() may differ from the ASCII table, are
+    redone the slow way.
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            data = f.read()
     except FileNotFoundError:
-        pass
+        return [], []
 
-    results.sort(key=lambda x: x['score'], reverse=True)
-    return results
+    raw = list(filter(None, map(bytes.strip, data.split(b'\n'))))
+    joined = b'\n'.join(raw)
+    del data
+    domains = joined.decode('utf-8', errors='ignore').split('\n')
+    labels = [
+        line.partition(b'.')[0]
+        for line in joined.translate(_LOWER_TABLE, _NON_LABEL_BYTES).split(b'\n')
+    ]
+
+    dropped = False
+    for i in [i for i, line in enumerate(raw) if not line.isascii()]:
+        domain = domains[i] = domains[i].strip()
+        if domain:
+            labels[i] = _NON_ALNUM_RE.sub('', domain.lower().split('.')[0]).encode('ascii')
+        else:
+            dropped = True
+    if dropped:
+        kept = [i for i, domain in enumerate(domains) if domain]
+        domains = [domains[i] for i in kept]
+        labels = [labels[i] for i in kept]
+    return domains, labels
 
 
 def fuzzy_search(pattern, filepath, maxchange=1, return_list=False):
@@ -45,21 +97,23 @@ def fuzzy_search(pattern, filepath, maxchange=1, return_list=False):
     if not has_fuzzysearch:
         return fuzzy_search_with_score(pattern, filepath)
 
+    # A match needs a substring of at least len(pattern) - maxchange
+    # characters, so shorter lines are skipped without running the search.
+    min_len = len(pattern) - maxchange
+
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    matches = find_near_matches(pattern, line, max_l_dist=maxchange)
-                    if matches:
-                        if return_list:
-                            results.append(line)
-                        else:
-                            print(line)
-                except Exception:
-                    pass
+        for line in iter_domains_from_file(filepath):
+            if len(line) < min_len:
+                continue
+            try:
+                matches = find_near_matches(pattern, line, max_l_dist=maxchange)
+                if matches:
+                    if return_list:
+                        results.append(line)
+                    else:
+                        print(line)
+            except Exception:
+                pass
     except FileNotFoundError:
         if not return_list:
             print(f'File not found: {filepath}')
@@ -67,3 +121,4 @@ def fuzzy_search(pattern, filepath, maxchange=1, return_list=False):
     if return_list:
         return results
     return None
+
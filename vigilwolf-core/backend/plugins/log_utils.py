@@ -1,11 +1,29 @@
 import re
 
+_ANSI_ESCAPE = re.compile(r"\x1B[@-_][0-?]*[ -/]*[@-~]")
+_BLANK_LINES = re.compile(r"\n{2,}")
+_ANSI_ESCAPE_BYTES = re.compile(rb"\x1B[@-_][0-?]*[ -/]*[@-~]")
+_BLANK_LINES_BYTES = re.compile(rb"\n{2,}")
 
-def clean_log(s: str) -> str:
+
+def clean_log(s: str | bytes) -> str:
     if not s:
         return ''
-    ansi_escape = re.compile(r"\x1B[@-_][0-?]*[ -/]*[@-~]")
-    no_ansi = ansi_escape.sub('', s)
-    no_ansi = no_ansi.replace('\r\n', '\n').replace('\r', '\n')
-    no_ansi = re.sub(r"\n{2,}", '\n\n', no_ansi)
-    return no_ansi.strip()
+    if isinstance(s, bytes):
+        # Clean raw subprocess output before decoding so the buffer is only
+        # turned into text once, at the end.
+        cleaned = _clean(s, _ANSI_ESCAPE_BYTES, _BLANK_LINES_BYTES, b'\x1b', b'\r', b'\n')
+        return cleaned.decode('utf-8', 'replace').strip()
+    return _clean(s, _ANSI_ESCAPE, _BLANK_LINES, '\x1b', '\r', '\n').strip()
+
+
+def _clean(s, ansi_escape, blank_lines, esc, cr, lf):
+    # Each pass is skipped when a substring scan shows it has nothing to do;
+    # collapsing runs of newlines only changes output for three or more.
+    if esc in s:
+        s = ansi_escape.sub(s[:0], s)
+    if cr in s:
+        s = s.replace(cr + lf, lf).replace(cr, lf)
+    if lf * 3 in s:
+        s = blank_lines.sub(lf * 2, s)
+    return s
@@ -6,11 +6,24 @@ Provides core business logic for:
 - Snapshot orchestration
 - Force dump triggering
 """
+import itertools
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from pathlib import Path
 from typing import List, Optional, Dict, Tuple
-from models import Group, Domain, Snapshot, PingLogEntry, DumpLogEntry
+from models import Group, Domain, Snapshot, PingLogEntry, DumpLogEntry, html_digest, utc_now_iso
 from plugins.storage_manager import get_storage_manager
 from plugins.capture_engine import get_capture_engine
-from config import MAX_DOMAINS_PER_GROUP
+from config import MAX_DOMAINS_PER_GROUP, MAX_CONCURRENT_CHECKS
+
+logger = logging.getLogger(__name__)
+
+# Threads for validate_all_snapshots; the work is filesystem stats, not CPU.
+VALIDATION_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 class MonitoringService:
     """Core monitoring service for managing groups and domains."""
@@ -19,6 +32,17 @@ class MonitoringService:
         """Initialize monitoring service."""
         self.storage = get_storage_manager()
         self.capture = get_capture_engine()
+        # First dumps are network-bound, so they run in the background, capped
+        # at the same concurrency the scheduler allows for checks.
+        self._dump_pool = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_CHECKS, thread_name_prefix="first-dump"
+        )
+        # First dumps queued or running, so a reset can drain them.
+        self._dump_futures = set()
+        self._dump_futures_lock = threading.Lock()
+        # Held while a group is persisted and its first dumps are queued, and
+        # for the whole of a reset, so no first dump is queued mid-reset.
+        self._first_dump_gate = threading.Lock()
     
     def create_group(
         self,
@@ -34,6 +58,10 @@ class MonitoringService:
                 - dump_mode: "html_only" or "html_and_assets"
                 - frequency_seconds: Check frequency in seconds
         
+        The group and domains are persisted before this returns; each domain's
+        first dump then runs on a background worker, which schedules the
+        domain's periodic checks once the dump has finished.
+        
         Returns:
             Tuple of (created Group, list of created Domains)
             
@@ -65,19 +93,54 @@ class MonitoringService:
             domains.append(domain)
             group.domain_ids.append(domain.id)
         
-        self.storage.save_group(group)
-        for domain in domains:
-            self.storage.save_domain(domain)
+        with self._first_dump_gate:
+            with self.storage.batch():
+                self.storage.save_group(group)
+                self.storage.save_domains(domains)
+            
+            for domain in domains:
+                future = self._dump_pool.submit(self._first_dump_and_schedule, domain)
+                with self._dump_futures_lock:
+                    self._dump_futures.add(future)
+                future.add_done_callback(self._forget_dump_future)
         
-        for domain in domains:
+        return group, domains
+    
+    def _first_dump_and_schedule(self, domain: Domain) -> None:
+        """Background task: first dump for a new domain, then its check schedule."""
+        try:
             self.perform_first_dump(domain)
+        except Exception as e:
+            logger.error(f"First dump failed for {domain.url}: {str(e)}", exc_info=True)
         
+        # Imported here: scheduler imports this module at load time.
         from scheduler import get_scheduler
-        scheduler = get_scheduler()
-        for domain in domains:
-            scheduler.schedule_domain_check(domain)
-        
-        return group, domains
+        get_scheduler().schedule_domain_check(domain)
+    
+    def _forget_dump_future(self, future) -> None:
+        with self._dump_futures_lock:
+            self._dump_futures.discard(future)
+    
+    @contextmanager
+    def first_dumps_drained(self):
+        """Cancel queued first dumps and wait for the running ones to finish.
+        
+        Wraps a reset: until the block exits, create_group waits before
+        persisting anything, so no first dump re-saves or re-schedules its
+        domain once the environment has been cleared. Blocks, so call it off
+        the event loop.
+        """
+        with self._first_dump_gate:
+            with self._dump_futures_lock:
+                pending = list(self._dump_futures)
+            for future in pending:
+                future.cancel()
+            wait(pending)
+            yield
+    
+    def shutdown(self) -> None:
+        """Drop queued first dumps and wait for the ones already running."""
+        self._dump_pool.shutdown(wait=True, cancel_futures=True)
     
     def get_all_groups(self) -> List[Group]:
         """Get all monitoring groups.
@@ -131,8 +194,7 @@ class MonitoringService:
         """
         snapshot = self._perform_dump(domain, trigger_type="initial")
         
-        from datetime import datetime
-        domain.last_checked_at = datetime.utcnow().isoformat() + 'Z'
+        domain.last_checked_at = utc_now_iso()
         self.storage.save_domain(domain)
         
         return snapshot
@@ -153,9 +215,6 @@ class MonitoringService:
         if domain is None:
             raise ValueError(f"Domain not found: {domain_id}")
         
-        import os
-        from pathlib import Path
-        
         lock_file = Path(self.storage.data_dir) / "snapshots" / domain_id / ".dump_lock"
         
         if lock_file.exists():
@@ -191,9 +250,6 @@ class MonitoringService:
         Returns:
             Created Snapshot object
         """
-        from datetime import datetime
-        from pathlib import Path
-        
         try:
             html_content, fetch_success = self.capture.fetch_html(domain.url)
             
@@ -237,15 +293,14 @@ class MonitoringService:
                 
                 return snapshot
             
-            timestamp = datetime.utcnow().isoformat() + 'Z'
+            timestamp = utc_now_iso()
             
             snapshot_dir = self.storage.create_snapshot_directory(domain.id, timestamp)
+            # Data-dir-relative form of snapshot_dir, shared by the paths below.
+            rel_snapshot_dir = Path(snapshot_dir).relative_to(self.storage.data_dir)
             
             html_path = self.storage.save_html(snapshot_dir, html_content)
             
-            import logging
-            logger = logging.getLogger(__name__)
-            
             screenshot_path = None
             screenshot_file = f"{snapshot_dir}/screenshot.png"
             
@@ -253,7 +308,7 @@ class MonitoringService:
             screenshot_success = self.capture.capture_screenshot(domain.url, screenshot_file)
             
             if screenshot_success:
-                screenshot_path = str(Path(snapshot_dir).relative_to(self.storage.data_dir) / "screenshot.png")
+                screenshot_path = str(rel_snapshot_dir / "screenshot.png")
                 logger.info(f"✓ Screenshot captured successfully: {screenshot_path}")
             else:
                 logger.warning(f"✗ Screenshot capture failed for {domain.url}, continuing without screenshot")
@@ -271,13 +326,13 @@ class MonitoringService:
                     asset_count = len(downloaded_assets)
                     
                     if asset_count > 0:
-                        assets_dir = str(Path(snapshot_dir).relative_to(self.storage.data_dir) / "assets")
+                        assets_dir = str(rel_snapshot_dir / "assets")
                 except Exception as e:
                     asset_count = 0
                     assets_dir = None
             
             snapshot = Snapshot(
-                id=str(__import__('uuid').uuid4()),
+                id=str(uuid.uuid4()),
                 domain_id=domain.id,
                 timestamp=timestamp,
                 trigger_type=trigger_type,
@@ -286,7 +341,8 @@ class MonitoringService:
                 assets_dir=assets_dir,
                 asset_count=asset_count,
                 success=True,
-                error_message=None
+                error_message=None,
+                html_sha256=html_digest(html_content)
             )
             
             self.storage.save_snapshot_metadata(snapshot)
@@ -334,6 +390,17 @@ class MonitoringService:
         """
         return self.storage.load_snapshots_for_domain(domain_id)
     
+    def get_snapshot(self, snapshot_id: str) -> Optional[Snapshot]:
+        """Get a specific snapshot's metadata without loading its content or logs.
+        
+        Args:
+            snapshot_id: ID of the snapshot
+            
+        Returns:
+            Snapshot object or None if not found
+        """
+        return self.storage.get_snapshot(snapshot_id)
+    
     def get_snapshot_details(self, snapshot_id: str) -> Optional[Dict]:
         """Get detailed information about a specific snapshot.
         
@@ -375,15 +442,16 @@ class MonitoringService:
         
         screenshot_exists = False
         if snapshot.screenshot_path:
-            screenshot_file = self.storage.data_dir / snapshot.screenshot_path
-            screenshot_exists = screenshot_file.exists()
+            screenshot_exists = os.path.exists(os.path.join(self.storage.data_dir, snapshot.screenshot_path))
         
         assets = []
         if snapshot.assets_dir:
-            assets_path = self.storage.data_dir / snapshot.assets_dir
-            if assets_path.exists() and assets_path.is_dir():
-                assets = [f.name for f in assets_path.iterdir() if f.is_file()]
-                assets.sort()  # Sort alphabetically
+            # One scandir pass; entry types come from the directory listing.
+            try:
+                with os.scandir(os.path.join(self.storage.data_dir, snapshot.assets_dir)) as entries:
+                    assets = sorted(entry.name for entry in entries if entry.is_file())
+            except OSError:
+                assets = []
         
         return {
             'snapshot': snapshot,
@@ -407,22 +475,23 @@ class MonitoringService:
         Returns:
             Dictionary mapping snapshot IDs to (is_valid, errors) tuples
         """
-        results = {}
-        
         if domain_id:
             snapshots = self.storage.load_snapshots_for_domain(domain_id)
-            for snapshot in snapshots:
-                is_valid, errors = self.storage.validate_snapshot(snapshot)
-                results[snapshot.id] = (is_valid, errors)
         else:
-            domains = self.storage.load_domains()
-            for domain in domains:
-                snapshots = self.storage.load_snapshots_for_domain(domain.id)
-                for snapshot in snapshots:
-                    is_valid, errors = self.storage.validate_snapshot(snapshot)
-                    results[snapshot.id] = (is_valid, errors)
+            snapshots = list(itertools.chain.from_iterable(
+                self.storage.load_snapshots_for_domain(domain.id)
+                for domain in self.storage.load_domains()
+            ))
+        
+        # Validation is a few stats per snapshot, so overlap them on threads.
+        if len(snapshots) > 1:
+            workers = min(len(snapshots), VALIDATION_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="validate") as pool:
+                outcomes = list(pool.map(self.storage.validate_snapshot, snapshots))
+        else:
+            outcomes = [self.storage.validate_snapshot(snapshot) for snapshot in snapshots]
         
-        return results
+        return {snapshot.id: outcome for snapshot, outcome in zip(snapshots, outcomes)}
     
     def _validate_domain_config(self, config: Dict[str, any]) -> None:
         """Validate a domain configuration.
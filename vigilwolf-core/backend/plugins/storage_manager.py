@@ -9,11 +9,26 @@ Handles all file system operations including:
 import os
 import json
 import fcntl
-from typing import List, Optional
+import mmap
+import copy
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import Callable, List, Optional, Tuple
 from pathlib import Path
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
 from models import Group, Domain, Snapshot, PingLogEntry, DumpLogEntry
 from config import MONITORING_DATA_DIR
 
+# Recently written/read snapshot pages kept in memory. The scheduler reads
+# the latest snapshot's HTML on every check and the UI re-opens recent
+# snapshots, so a small cache covers both.
+HTML_CACHE_SIZE = 32
+
 class StorageManager:
     """Manages all file system operations for the monitoring system."""
     
@@ -23,13 +38,46 @@ class StorageManager:
         self.groups_file = self.data_dir / "groups.json"
         self.domains_file = self.data_dir / "domains.json"
         self.snapshots_dir = self.data_dir / "snapshots"
+        self.snapshot_index_file = self.data_dir / "snapshot_index.json"
+        self.snapshot_index_log = self.data_dir / "snapshot_index.log"
+        
+        # Parsed groups/domains (plus an id -> object index) keyed on the
+        # (mtime_ns, size) of their file. Cached objects are never handed out
+        # directly; callers get copies.
+        self._metadata_cache: dict = {}
+        self._metadata_lock = threading.RLock()
+        # Active-domain count, tied to the cached domains tuple it was computed from.
+        self._active_count: Tuple[tuple, int] = ((), 0)
+        # group_id -> that group's domains, tied to the cached domains tuple
+        # it was built from, like the active count.
+        self._domains_by_group: Tuple[tuple, dict] = ((), {})
+        # file_path -> cache entry not yet written, while batch() is active.
+        self._pending_writes: Optional[dict] = None
+        # Snapshot id -> metadata.json path relative to data_dir, mirrored in
+        # snapshot_index_file plus the changes appended to snapshot_index_log
+        # since; loaded (or rebuilt from the tree) on first use.
+        self._snapshot_index: Optional[dict] = None
+        self._snapshot_index_lock = threading.RLock()
+        # Set once the index has been rebuilt from the tree, which a lookup
+        # miss does at most once per process.
+        self._snapshot_index_rebuilt = False
+        # domain_id -> its most recent Snapshot, filled on first lookup and
+        # kept current by save_snapshot_metadata (guarded by the index lock).
+        self._latest_snapshots: dict = {}
+        # Relative html_path -> ((mtime_ns, size), content), most recent last.
+        self._html_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._html_lock = threading.Lock()
         
         self._ensure_directories()
     
     def _ensure_directories(self) -> None:
-        """Create necessary directories if they don't exist."""
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+        """Create necessary directories if they don't exist.
+
+        snapshots_dir sits inside data_dir, so one stat covers the common case
+        where both already exist and one ``mkdir(parents=True)`` creates both.
+        """
+        if not self.snapshots_dir.is_dir():
+            self.snapshots_dir.mkdir(parents=True, exist_ok=True)
     
     def save_group(self, group: Group) -> None:
         """Save a single group to the groups file.
@@ -37,20 +85,21 @@ class StorageManager:
         Args:
             group: Group object to save
         """
-        groups = self.load_groups()
-        
-        existing_index = None
-        for i, g in enumerate(groups):
-            if g.id == group.id:
-                existing_index = i
-                break
-        
-        if existing_index is not None:
-            groups[existing_index] = group
-        else:
-            groups.append(group)
-        
-        self._write_json_file(self.groups_file, [g.to_dict() for g in groups])
+        with self._metadata_lock:
+            groups = list(self._load_cached(self.groups_file, Group.from_dict))
+            
+            existing_index = None
+            for i, g in enumerate(groups):
+                if g.id == group.id:
+                    existing_index = i
+                    break
+            
+            if existing_index is not None:
+                groups[existing_index] = _copy_group(group)
+            else:
+                groups.append(_copy_group(group))
+            
+            self._write_cached(self.groups_file, groups)
     
     def load_groups(self) -> List[Group]:
         """Load all groups from the groups file.
@@ -58,11 +107,7 @@ class StorageManager:
         Returns:
             List of Group objects
         """
-        if not self.groups_file.exists():
-            return []
-        
-        data = self._read_json_file(self.groups_file)
-        return [Group.from_dict(g) for g in data]
+        return [_copy_group(g) for g in self._load_cached(self.groups_file, Group.from_dict)]
     
     def get_group(self, group_id: str) -> Optional[Group]:
         """Get a specific group by ID.
@@ -73,11 +118,8 @@ class StorageManager:
         Returns:
             Group object or None if not found
         """
-        groups = self.load_groups()
-        for group in groups:
-            if group.id == group_id:
-                return group
-        return None
+        group = self._load_index(self.groups_file, Group.from_dict).get(group_id)
+        return _copy_group(group) if group is not None else None
     
     def save_domain(self, domain: Domain) -> None:
         """Save a single domain to the domains file.
@@ -85,20 +127,27 @@ class StorageManager:
         Args:
             domain: Domain object to save
         """
-        domains = self.load_domains()
-        
-        existing_index = None
-        for i, d in enumerate(domains):
-            if d.id == domain.id:
-                existing_index = i
-                break
-        
-        if existing_index is not None:
-            domains[existing_index] = domain
-        else:
-            domains.append(domain)
+        self.save_domains([domain])
+    
+    def save_domains(self, domains: List[Domain]) -> None:
+        """Save several domains to the domains file with a single write.
         
-        self._write_json_file(self.domains_file, [d.to_dict() for d in domains])
+        Args:
+            domains: Domain objects to save; existing ids are replaced in place
+        """
+        with self._metadata_lock:
+            stored = list(self._load_cached(self.domains_file, Domain.from_dict))
+            positions = {d.id: i for i, d in enumerate(stored)}
+            
+            for domain in domains:
+                existing_index = positions.get(domain.id)
+                if existing_index is not None:
+                    stored[existing_index] = copy.copy(domain)
+                else:
+                    positions[domain.id] = len(stored)
+                    stored.append(copy.copy(domain))
+            
+            self._write_cached(self.domains_file, stored)
     
     def load_domains(self) -> List[Domain]:
         """Load all domains from the domains file.
@@ -106,11 +155,7 @@ class StorageManager:
         Returns:
             List of Domain objects
         """
-        if not self.domains_file.exists():
-            return []
-        
-        data = self._read_json_file(self.domains_file)
-        return [Domain.from_dict(d) for d in data]
+        return [copy.copy(d) for d in self._load_cached(self.domains_file, Domain.from_dict)]
     
     def get_domain(self, domain_id: str) -> Optional[Domain]:
         """Get a specific domain by ID.
@@ -121,11 +166,8 @@ class StorageManager:
         Returns:
             Domain object or None if not found
         """
-        domains = self.load_domains()
-        for domain in domains:
-            if domain.id == domain_id:
-                return domain
-        return None
+        domain = self._load_index(self.domains_file, Domain.from_dict).get(domain_id)
+        return copy.copy(domain) if domain is not None else None
     
     def get_domains_by_group(self, group_id: str) -> List[Domain]:
         """Get all domains belonging to a specific group.
@@ -136,8 +178,40 @@ class StorageManager:
         Returns:
             List of Domain objects
         """
-        domains = self.load_domains()
-        return [d for d in domains if d.group_id == group_id]
+        with self._metadata_lock:
+            domains = self._load_cached(self.domains_file, Domain.from_dict)
+            indexed_for, by_group = self._domains_by_group
+            if indexed_for is not domains:
+                by_group = {}
+                for d in domains:
+                    by_group.setdefault(d.group_id, []).append(d)
+                self._domains_by_group = (domains, by_group)
+        return [copy.copy(d) for d in by_group.get(group_id, ())]
+    
+    def count_groups(self) -> int:
+        """Get the number of groups without copying them.
+        
+        Returns:
+            Number of stored groups
+        """
+        return len(self._load_cached(self.groups_file, Group.from_dict))
+    
+    def count_domains(self) -> Tuple[int, int]:
+        """Get total and active domain counts without copying the domains.
+        
+        The active count is only recomputed when the domain list changes, so
+        repeated calls (e.g. health polling) are constant time.
+        
+        Returns:
+            Tuple of (total domains, active domains)
+        """
+        with self._metadata_lock:
+            domains = self._load_cached(self.domains_file, Domain.from_dict)
+            counted_for, active = self._active_count
+            if counted_for is not domains:
+                active = sum(1 for d in domains if d.active)
+                self._active_count = (domains, active)
+            return len(domains), active
     
     def create_snapshot_directory(self, domain_id: str, timestamp: str) -> str:
         """Create a directory for a new snapshot.
@@ -169,27 +243,63 @@ class StorageManager:
         
         metadata_file = snapshot_dir / "metadata.json"
         self._write_json_file(metadata_file, snapshot.to_dict())
+        
+        with self._snapshot_index_lock:
+            self._set_snapshot_index_entry(
+                snapshot.id, str(metadata_file.relative_to(self.data_dir))
+            )
+            
+            latest = self._latest_snapshots.get(snapshot.domain_id)
+            if latest is None or snapshot.timestamp >= latest.timestamp:
+                self._latest_snapshots[snapshot.domain_id] = replace(snapshot)
     
-    def load_snapshots_for_domain(self, domain_id: str) -> List[Snapshot]:
-        """Load all snapshots for a specific domain.
+    def get_latest_snapshot(self, domain_id: str) -> Optional[Snapshot]:
+        """Get the most recent snapshot of a domain.
+        
+        Served from memory after the first lookup, so periodic checks do not
+        re-read every snapshot's metadata.
         
         Args:
             domain_id: ID of the domain
             
         Returns:
-            List of Snapshot objects ordered by timestamp
+            Latest Snapshot object, or None if the domain has no snapshots
         """
-        domain_dir = self.snapshots_dir / domain_id
-        if not domain_dir.exists():
-            return []
+        with self._snapshot_index_lock:
+            latest = self._latest_snapshots.get(domain_id)
+            if latest is None:
+                snapshots = self.load_snapshots_for_domain(domain_id, limit=1)
+                if not snapshots:
+                    return None
+                latest = self._latest_snapshots[domain_id] = snapshots[-1]
+            return replace(latest)
+    
+    def load_snapshots_for_domain(self, domain_id: str, limit: Optional[int] = None) -> List[Snapshot]:
+        """Load the snapshots for a specific domain.
         
+        Snapshot directories are named after their ISO timestamp, so sorting
+        the names orders them chronologically and only the metadata of the
+        requested window is read.
+        
+        Args:
+            domain_id: ID of the domain
+            limit: If given, only the most recent ``limit`` snapshots are loaded
+            
+        Returns:
+            List of Snapshot objects ordered by timestamp
+        """
+        # Same parent, so sorting the paths sorts the directory names.
+        snapshot_dirs = sorted(_subdirectories(os.path.join(self.snapshots_dir, domain_id)))
         snapshots = []
-        for snapshot_dir in domain_dir.iterdir():
-            if snapshot_dir.is_dir():
-                metadata_file = snapshot_dir / "metadata.json"
-                if metadata_file.exists():
-                    data = self._read_json_file(metadata_file)
-                    snapshots.append(Snapshot.from_dict(data))
+        for snapshot_dir in reversed(snapshot_dirs):
+            if limit is not None and len(snapshots) >= limit:
+                break
+            # A directory without metadata (e.g. a dump still in progress)
+            # does not count towards the limit.
+            metadata_file = os.path.join(snapshot_dir, "metadata.json")
+            if os.path.exists(metadata_file):
+                data = self._read_json_file(Path(metadata_file))
+                snapshots.append(Snapshot.from_dict(data))
         
         snapshots.sort(key=lambda s: s.timestamp)
         return snapshots
@@ -203,18 +313,119 @@ class StorageManager:
         Returns:
             Snapshot object or None if not found
         """
-        for domain_dir in self.snapshots_dir.iterdir():
-            if domain_dir.is_dir():
-                for snapshot_dir in domain_dir.iterdir():
-                    if snapshot_dir.is_dir():
-                        metadata_file = snapshot_dir / "metadata.json"
-                        if metadata_file.exists():
-                            data = self._read_json_file(metadata_file)
-                            snapshot = Snapshot.from_dict(data)
-                            if snapshot.id == snapshot_id:
-                                return snapshot
+        with self._snapshot_index_lock:
+            rel_path = self._get_snapshot_index().get(snapshot_id)
+            if rel_path is None and not self._snapshot_index_rebuilt:
+                # The metadata may have been written without its index entry
+                # (e.g. the append failed); one walk of the tree recovers it.
+                rel_path = self._rebuild_snapshot_index().get(snapshot_id)
+        if rel_path is None:
+            return None
+        
+        metadata_file = self.data_dir / rel_path
+        if metadata_file.exists():
+            snapshot = Snapshot.from_dict(self._read_json_file(metadata_file))
+            if snapshot.id == snapshot_id:
+                return snapshot
+        
+        # Removed (or replaced) behind our back: forget the stale entry.
+        with self._snapshot_index_lock:
+            if self._get_snapshot_index().get(snapshot_id) == rel_path:
+                self._set_snapshot_index_entry(snapshot_id, None)
         return None
     
+    def _get_snapshot_index(self) -> dict:
+        """Return the in-memory snapshot index, loading it on first use.
+        
+        The changes appended to the log since the last load are replayed over
+        the index file and then folded into it (compacted), so the log only
+        ever holds one process's worth of saves. A missing or unreadable index
+        file (e.g. data written before the index existed) is rebuilt with one
+        walk over the snapshot tree.
+        """
+        with self._snapshot_index_lock:
+            if self._snapshot_index is None:
+                index = None
+                if self.snapshot_index_file.exists():
+                    index = self._read_json_file(self.snapshot_index_file)
+                if not isinstance(index, dict):
+                    return self._rebuild_snapshot_index()
+                if self._replay_snapshot_index_log(index):
+                    self._write_snapshot_index(index)
+                self._snapshot_index = index
+            return self._snapshot_index
+    
+    def _set_snapshot_index_entry(self, snapshot_id: str, rel_path: Optional[str]) -> None:
+        """Record (or, with rel_path None, forget) one snapshot in the index.
+        
+        Only a line is appended to the log; the index file itself is
+        rewritten when the log is compacted on the next load.
+        """
+        with self._snapshot_index_lock:
+            index = self._get_snapshot_index()
+            if rel_path is None:
+                index.pop(snapshot_id, None)
+            else:
+                index[snapshot_id] = rel_path
+            self._append_log_entry(
+                self.snapshot_index_log, json.dumps({'id': snapshot_id, 'path': rel_path})
+            )
+    
+    def _replay_snapshot_index_log(self, index: dict) -> bool:
+        """Apply the logged index changes to index; False if there were none.
+        
+        A torn last line (a crash mid-append) is skipped; the rebuild on a
+        lookup miss picks up whatever it described.
+        """
+        try:
+            raw = self.snapshot_index_log.read_bytes()
+        except FileNotFoundError:
+            return False
+        
+        loads = orjson.loads if orjson is not None else json.loads
+        for line in raw.splitlines():
+            try:
+                change = loads(line)
+            except ValueError:
+                continue
+            if not isinstance(change, dict) or 'id' not in change:
+                continue
+            if change.get('path') is None:
+                index.pop(change['id'], None)
+            else:
+                index[change['id']] = change['path']
+        return True
+    
+    def _write_snapshot_index(self, index: dict) -> None:
+        """Write the full index file and drop the log it now includes."""
+        self._write_json_file(self.snapshot_index_file, index)
+        try:
+            self.snapshot_index_log.unlink()
+        except FileNotFoundError:
+            pass
+    
+    def _rebuild_snapshot_index(self) -> dict:
+        """Rebuild the index from the snapshot tree, store it and return it."""
+        with self._snapshot_index_lock:
+            index = self._build_snapshot_index()
+            self._write_snapshot_index(index)
+            self._snapshot_index = index
+            self._snapshot_index_rebuilt = True
+            return index
+    
+    def _build_snapshot_index(self) -> dict:
+        """Map every snapshot id on disk to its metadata.json (relative path)."""
+        index = {}
+        data_dir = str(self.data_dir)
+        for domain_dir in _subdirectories(str(self.snapshots_dir)):
+            for snapshot_dir in _subdirectories(domain_dir):
+                metadata_file = os.path.join(snapshot_dir, "metadata.json")
+                if os.path.exists(metadata_file):
+                    data = self._read_json_file(Path(metadata_file))
+                    if isinstance(data, dict) and 'id' in data:
+                        index[data['id']] = os.path.relpath(metadata_file, data_dir)
+        return index
+    
     def validate_snapshot(self, snapshot: Snapshot) -> tuple[bool, list[str]]:
         """Validate a snapshot's integrity.
         
@@ -240,7 +451,9 @@ class StorageManager:
         with open(html_file, 'w', encoding='utf-8', newline='') as f:
             f.write(html_content)
         
-        return str(html_file.relative_to(self.data_dir))
+        html_path = str(html_file.relative_to(self.data_dir))
+        self._cache_html(html_path, self._file_signature(html_file), html_content)
+        return html_path
     
     def load_html(self, html_path: str) -> str:
         """Load HTML content from a file.
@@ -252,8 +465,27 @@ class StorageManager:
             HTML content as string
         """
         full_path = self.data_dir / html_path
+        signature = self._file_signature(full_path)
+        with self._html_lock:
+            cached = self._html_cache.get(html_path)
+            if cached is not None and signature is not None and cached[0] == signature:
+                self._html_cache.move_to_end(html_path)
+                return cached[1]
+        
         with open(full_path, 'r', encoding='utf-8', newline='') as f:
-            return f.read()
+            content = f.read()
+        self._cache_html(html_path, signature, content)
+        return content
+    
+    def _cache_html(self, html_path: str, signature: Optional[Tuple[int, int]], content: str) -> None:
+        """Remember a page's content under its (mtime_ns, size) signature."""
+        if signature is None:
+            return
+        with self._html_lock:
+            self._html_cache[html_path] = (signature, content)
+            self._html_cache.move_to_end(html_path)
+            if len(self._html_cache) > HTML_CACHE_SIZE:
+                self._html_cache.popitem(last=False)
     
     def append_ping_log(self, domain_id: str, entry: PingLogEntry) -> None:
         """Append a ping log entry to the domain's ping log.
@@ -268,27 +500,20 @@ class StorageManager:
         log_file = domain_dir / "ping.log"
         self._append_log_entry(log_file, entry.to_json())
     
-    def read_ping_log(self, domain_id: str) -> List[PingLogEntry]:
-        """Read all ping log entries for a domain.
+    def read_ping_log(self, domain_id: str, limit: Optional[int] = None) -> List[PingLogEntry]:
+        """Read the ping log entries for a domain.
         
         Args:
             domain_id: ID of the domain
+            limit: If given, only the most recent ``limit`` entries are read
             
         Returns:
             List of PingLogEntry objects ordered chronologically
         """
-        domain_dir = self.snapshots_dir / domain_id
-        log_file = domain_dir / "ping.log"
-        
-        if not log_file.exists():
-            return []
-        
-        entries = []
-        for line in log_file.read_text(encoding='utf-8').strip().split('\n'):
-            if line:
-                entries.append(PingLogEntry.from_json(line))
-        
-        return entries
+        log_file = self.snapshots_dir / domain_id / "ping.log"
+        if limit is not None:
+            return self._read_log_tail(log_file, PingLogEntry.from_dict, limit)
+        return self._read_log_entries(log_file, PingLogEntry.from_dict)
     
     def append_dump_log(self, domain_id: str, entry: DumpLogEntry) -> None:
         """Append a dump log entry to the domain's dump log.
@@ -303,27 +528,104 @@ class StorageManager:
         log_file = domain_dir / "dump.log"
         self._append_log_entry(log_file, entry.to_json())
     
-    def read_dump_log(self, domain_id: str) -> List[DumpLogEntry]:
-        """Read all dump log entries for a domain.
+    def read_dump_log(self, domain_id: str, limit: Optional[int] = None) -> List[DumpLogEntry]:
+        """Read the dump log entries for a domain.
         
         Args:
             domain_id: ID of the domain
+            limit: If given, only the most recent ``limit`` entries are read
             
         Returns:
             List of DumpLogEntry objects ordered chronologically
         """
-        domain_dir = self.snapshots_dir / domain_id
-        log_file = domain_dir / "dump.log"
-        
-        if not log_file.exists():
-            return []
+        log_file = self.snapshots_dir / domain_id / "dump.log"
+        if limit is not None:
+            return self._read_log_tail(log_file, DumpLogEntry.from_dict, limit)
+        return self._read_log_entries(log_file, DumpLogEntry.from_dict)
+    
+    def _file_signature(self, file_path: Path) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) of a file, or None if it does not exist."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _load_entry(self, file_path: Path, from_dict: Callable) -> tuple:
+        """Load a metadata list file, re-parsing only when it changed on disk.
         
-        entries = []
-        for line in log_file.read_text(encoding='utf-8').strip().split('\n'):
-            if line:
-                entries.append(DumpLogEntry.from_json(line))
+        Args:
+            file_path: Path to groups.json or domains.json
+            from_dict: Model constructor for one entry
+            
+        Returns:
+            Tuple of (signature, model objects, id -> object dict); the cached
+            objects must not be mutated
+        """
+        with self._metadata_lock:
+            if self._pending_writes is not None and file_path in self._pending_writes:
+                return self._pending_writes[file_path]
+            
+            signature = self._file_signature(file_path)
+            if signature is None:
+                return (None, (), {})
+            
+            cached = self._metadata_cache.get(file_path)
+            if cached is not None and cached[0] == signature:
+                return cached
+            
+            items = tuple(from_dict(d) for d in self._read_json_file(file_path))
+            entry = (signature, items, {item.id: item for item in items})
+            self._metadata_cache[file_path] = entry
+            return entry
+    
+    def _load_cached(self, file_path: Path, from_dict: Callable) -> tuple:
+        """Get the cached model objects of a metadata list file, in file order."""
+        return self._load_entry(file_path, from_dict)[1]
+    
+    def _load_index(self, file_path: Path, from_dict: Callable) -> dict:
+        """Get the cached id -> model object index of a metadata list file."""
+        return self._load_entry(file_path, from_dict)[2]
+    
+    @contextmanager
+    def batch(self):
+        """Group metadata saves so each file is written once, on exit.
+        
+        Inside the block, save_group/save_domain(s) only update the in-memory
+        state (which reads see immediately); groups.json and domains.json are
+        each written once when the block ends, even if it raised. The metadata
+        lock is held throughout, so other threads' saves wait for the flush.
+        Nested batches join the outermost one.
+        """
+        with self._metadata_lock:
+            if self._pending_writes is not None:
+                yield self
+                return
+            self._pending_writes = {}
+            try:
+                yield self
+            finally:
+                pending, self._pending_writes = self._pending_writes, None
+                for file_path, (_, items, _) in pending.items():
+                    self._write_cached(file_path, list(items))
+    
+    def _write_cached(self, file_path: Path, items: list) -> None:
+        """Write a metadata list file and keep the parsed objects cached.
         
-        return entries
+        Args:
+            file_path: Path to groups.json or domains.json
+            items: Model objects owned by the cache
+        """
+        with self._metadata_lock:
+            if self._pending_writes is not None:
+                self._pending_writes[file_path] = (None, tuple(items), {item.id: item for item in items})
+                return
+            self._write_json_file(file_path, [item.to_dict() for item in items])
+            self._metadata_cache[file_path] = (
+                self._file_signature(file_path),
+                tuple(items),
+                {item.id: item for item in items}
+            )
     
     def _read_json_file(self, file_path: Path) -> dict | list:
         """Read and parse a JSON file.
@@ -335,11 +637,12 @@ class StorageManager:
             Parsed JSON data (empty list if file is empty or invalid)
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
+            with open(file_path, 'rb') as f:
                 content = f.read().strip()
-                if not content:
-                    return []
-                return json.loads(content)
+            if not content:
+                return []
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+            return orjson.loads(content) if orjson is not None else json.loads(content)
         except json.JSONDecodeError:
             import logging
             logging.warning(f"Invalid JSON in file {file_path}, returning empty list")
@@ -352,27 +655,106 @@ class StorageManager:
     def _write_json_file(self, file_path: Path, data: dict | list) -> None:
         """Write data to a JSON file with proper formatting.
         
+        The whole document is serialized first and written with one call to
+        a sibling temp file, which is then renamed over the target, so readers
+        never see a partially written file.
+        
         Args:
             file_path: Path to the JSON file
             data: Data to write
         """
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            f.write('\n')  # Add trailing newline
+        if orjson is not None:
+            # Same layout as json.dump(indent=2, ensure_ascii=False), already
+            # UTF-8 encoded and with the trailing newline.
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        else:
+            payload = (json.dumps(data, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+        
+        # Unique per process and thread; created like open(..., 'w') would
+        # (mode 0o666 less the umask) so the renamed file keeps the usual mode.
+        tmp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
     
     def _append_log_entry(self, log_file: Path, entry_json: str) -> None:
         """Append a log entry to a log file with file locking.
         
+        The line is encoded once and written straight to an O_APPEND
+        descriptor, without a buffered text file object in between.
+        
         Args:
             log_file: Path to the log file
             entry_json: JSON string of the log entry
         """
-        with open(log_file, 'a', encoding='utf-8') as f:
-            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        data = (entry_json + '\n').encode('utf-8')
+        fd = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            # Closing the descriptor also releases the lock.
+            os.close(fd)
+    
+    def _read_log_entries(self, log_file: Path, from_dict: Callable) -> list:
+        """Parse every line of a JSON-lines log file (empty list if it is missing).
+        
+        The file is read as bytes and each line is handed straight to the JSON
+        parser, skipping the text decode and the intermediate stripped copy.
+        """
+        try:
+            raw = log_file.read_bytes()
+        except FileNotFoundError:
+            return []
+        
+        loads = orjson.loads if orjson is not None else json.loads
+        return [from_dict(loads(line)) for line in raw.splitlines() if line.strip()]
+    
+    def _read_log_tail(self, log_file: Path, from_dict: Callable, limit: int) -> list:
+        """Parse the last ``limit`` non-empty lines of a JSON-lines log file.
+        
+        The file is mapped and scanned backwards from its end, so only the
+        requested lines are touched however long the log has grown.
+        """
+        if limit <= 0:
+            return []
+        try:
+            fd = os.open(log_file, os.O_RDONLY)
+        except FileNotFoundError:
+            return []
+        try:
             try:
-                f.write(entry_json + '\n')
-            finally:
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped.
+                return []
+        finally:
+            os.close(fd)
+        
+        lines = []
+        try:
+            end = len(mm)
+            while end > 0 and len(lines) < limit:
+                start = mm.rfind(b'\n', 0, end) + 1
+                line = mm[start:end]
+                if line.strip():
+                    lines.append(line)
+                end = start - 1
+        finally:
+            mm.close()
+        
+        loads = orjson.loads if orjson is not None else json.loads
+        return [from_dict(loads(line)) for line in reversed(lines)]
     
     def reset_environment(self) -> dict:
         """Reset the monitoring environment by clearing all data.
@@ -393,20 +775,10 @@ class StorageManager:
             'snapshots_deleted': 0
         }
         
-        if self.groups_file.exists():
-            groups = self.load_groups()
-            stats['groups_deleted'] = len(groups)
-        
-        if self.domains_file.exists():
-            domains = self.load_domains()
-            stats['domains_deleted'] = len(domains)
-        
-        if self.snapshots_dir.exists():
-            for domain_dir in self.snapshots_dir.iterdir():
-                if domain_dir.is_dir():
-                    for snapshot_dir in domain_dir.iterdir():
-                        if snapshot_dir.is_dir():
-                            stats['snapshots_deleted'] += 1
+        # The counts come from the cached metadata; copying every object just
+        # to take len() of the list is unnecessary.
+        stats['groups_deleted'] = self.count_groups()
+        stats['domains_deleted'], _ = self.count_domains()
         
         if self.groups_file.exists():
             self.groups_file.unlink()
@@ -414,16 +786,38 @@ class StorageManager:
         if self.domains_file.exists():
             self.domains_file.unlink()
         
-        if self.snapshots_dir.exists():
-            shutil.rmtree(self.snapshots_dir)
-        
-        self._ensure_directories()
+        with self._snapshot_index_lock:
+            # The index lists every saved snapshot, so it gives the count
+            # without walking the tree that is about to be deleted.
+            stats['snapshots_deleted'] = len(self._get_snapshot_index())
+            shutil.rmtree(self.snapshots_dir, ignore_errors=True)
+            self._ensure_directories()
+            self._snapshot_index = {}
+            self._latest_snapshots.clear()
+            self._write_snapshot_index(self._snapshot_index)
         
-        self._write_json_file(self.groups_file, [])
-        self._write_json_file(self.domains_file, [])
+        with self._metadata_lock:
+            self._write_cached(self.groups_file, [])
+            self._write_cached(self.domains_file, [])
         
         return stats
 
+def _subdirectories(path: str) -> List[str]:
+    """Paths of the directories directly inside path ([] if it is missing).
+    
+    scandir reports the entry type from the directory listing itself, so no
+    per-entry stat is needed; symlinks are not followed.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+def _copy_group(group: Group) -> Group:
+    """Copy a group, including its mutable domain_ids list."""
+    return replace(group, domain_ids=list(group.domain_ids))
+
 _storage_manager = None
 
 def get_storage_manager() -> StorageManager:
@@ -1,3 +1,7 @@
+import asyncio
+import locale
+import anyio
+import shutil
 import subprocess
 import re
 from datetime import datetime
@@ -29,67 +33,109 @@ def get_whois_info_python_whois(domain):
     except Exception as e:
         raise Exception(f"python-whois failed: {str(e)}")
 
+# Absolute path + close_fds=False lets CPython use posix_spawn for the child.
+WHOIS_EXECUTABLE = shutil.which('whois') or 'whois'
+
+# Every field label as a zero-width lookahead, so a single finditer pass
+# visits each position where any label starts (the labels never overlap at
+# one position) and each field sees the same first match a separate
+# re.search would. The named group says which field matched.
+_WHOIS_FIELD_RE = re.compile(
+    r'(?=(?:Registrar|Sponsoring Registrar):\s*(?P<registrar>.+))'
+    r'|(?=(?:Creation Date|Created|Registration Time):\s*(?P<creation_date>.+))'
+    r'|(?=(?:Expir(?:y|ation) Date|Expires|Registry Expiry Date):\s*(?P<expiration_date>.+))'
+    r'|(?=(?:Updated Date|Last Updated|Modified):\s*(?P<updated_date>.+))'
+    r'|(?=(?:Name Server|nserver):\s*(?P<name_servers>.+))',
+    re.IGNORECASE
+)
+
 def get_whois_info_subprocess(domain):
     """Fallback method: Use system whois command"""
     try:
         result = subprocess.run(
-            ['whois', domain],
+            [WHOIS_EXECUTABLE, domain],
             capture_output=True,
             text=True,
-            timeout=30
+            timeout=30,
+            close_fds=False
         )
         
         if result.returncode != 0:
             raise Exception(f"whois command failed with code {result.returncode}")
         
-        whois_text = result.stdout
-        
-        # Parse the raw whois output
-        parsed = {
-            'domain_name': domain,
-            'registrar': None,
-            'creation_date': None,
-            'expiration_date': None,
-            'updated_date': None,
-            'name_servers': [],
-            'status': None,
-            'emails': None,
-            'country': None,
-            'raw_output': whois_text[:500]  # Include first 500 chars of raw output
-        }
-        
-        # Extract registrar
-        registrar_match = re.search(r'(?:Registrar|Sponsoring Registrar):\s*(.+)', whois_text, re.IGNORECASE)
-        if registrar_match:
-            parsed['registrar'] = registrar_match.group(1).strip()
-        
-        # Extract dates
-        creation_match = re.search(r'(?:Creation Date|Created|Registration Time):\s*(.+)', whois_text, re.IGNORECASE)
-        if creation_match:
-            parsed['creation_date'] = creation_match.group(1).strip()
-        
-        expiration_match = re.search(r'(?:Expir(?:y|ation) Date|Expires|Registry Expiry Date):\s*(.+)', whois_text, re.IGNORECASE)
-        if expiration_match:
-            parsed['expiration_date'] = expiration_match.group(1).strip()
+        return _parse_whois_text(domain, result.stdout)
         
-        updated_match = re.search(r'(?:Updated Date|Last Updated|Modified):\s*(.+)', whois_text, re.IGNORECASE)
-        if updated_match:
-            parsed['updated_date'] = updated_match.group(1).strip()
+    except subprocess.TimeoutExpired:
+        raise Exception("whois command timed out")
+    except FileNotFoundError:
+        raise Exception("whois command not found on system")
+    except Exception as e:
+        raise Exception(f"subprocess whois failed: {str(e)}")
+
+async def get_whois_info_subprocess_async(domain):
+    """Fallback method on the event loop: await the system whois command.
+    
+    Same result and errors as get_whois_info_subprocess, but no thread is
+    held while the command waits on the network.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            WHOIS_EXECUTABLE, domain,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            close_fds=False
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=30)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
         
-        # Extract name servers
-        ns_matches = re.findall(r'(?:Name Server|nserver):\s*(.+)', whois_text, re.IGNORECASE)
-        if ns_matches:
-            parsed['name_servers'] = [ns.strip().lower() for ns in ns_matches]
+        if proc.returncode != 0:
+            raise Exception(f"whois command failed with code {proc.returncode}")
         
-        return parsed
+        # Decode like subprocess.run(text=True): locale encoding, universal newlines.
+        whois_text = stdout.decode(locale.getpreferredencoding(False))
+        whois_text = whois_text.replace('\r\n', '\n').replace('\r', '\n')
+        return _parse_whois_text(domain, whois_text)
         
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         raise Exception("whois command timed out")
     except FileNotFoundError:
         raise Exception("whois command not found on system")
     except Exception as e:
         raise Exception(f"subprocess whois failed: {str(e)}")
 
+def _parse_whois_text(domain, whois_text):
+    """Parse raw whois command output into the WHOIS result fields."""
+    parsed = {
+        'domain_name': domain,
+        'registrar': None,
+        'creation_date': None,
+        'expiration_date': None,
+        'updated_date': None,
+        'name_servers': [],
+        'status': None,
+        'emails': None,
+        'country': None,
+        'raw_output': whois_text[:500]  # Include first 500 chars of raw output
+    }
+    
+    # Extract registrar, dates and name servers in one pass
+    ns_end = 0
+    for match in _WHOIS_FIELD_RE.finditer(whois_text):
+        field = match.lastgroup
+        if field == 'name_servers':
+            # Like findall, skip labels inside the previous server's value.
+            if match.start() >= ns_end:
+                parsed['name_servers'].append(match.group(field).strip().lower())
+                ns_end = match.end(field)
+        elif parsed[field] is None:
+            parsed[field] = match.group(field).strip()
+    
+    return parsed
+
 def get_whois_info(domain):
     """
     Get WHOIS information for a domain with multiple fallback methods.
@@ -123,3 +169,36 @@ def get_whois_info(domain):
         'details': errors,
         'domain': domain
     }
+
+async def get_whois_info_async(domain):
+    """
+    Async counterpart of get_whois_info, returning the same result.
+    
+    python-whois is blocking, so it runs in a worker thread; the subprocess
+    fallback is awaited on the event loop. Many lookups can therefore run
+    concurrently (e.g. with asyncio.gather) without one thread each.
+    """
+    errors = []
+    
+    # Method 1: Try python-whois library
+    try:
+        result = await anyio.to_thread.run_sync(get_whois_info_python_whois, domain)
+        result['method'] = 'python-whois'
+        return result
+    except Exception as e:
+        errors.append(f"Method 1 (python-whois): {str(e)}")
+    
+    # Method 2: Try system whois command
+    try:
+        result = await get_whois_info_subprocess_async(domain)
+        result['method'] = 'subprocess'
+        return result
+    except Exception as e:
+        errors.append(f"Method 2 (subprocess): {str(e)}")
+    
+    # All methods failed
+    return {
+        'error': 'All WHOIS lookup methods failed',
+        'details': errors,
+        'domain': domain
+    }
@@ -5,14 +5,21 @@ Handles:
 - Change detection and automatic dump triggering
 - Scheduler lifecycle management
 """
+import threading
 from typing import Optional
-from datetime import datetime
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
-from models import Domain, PingLogEntry
+from models import Domain, PingLogEntry, html_digest, utc_now_iso
 from plugins.monitoring_service import get_monitoring_service
 from plugins.storage_manager import get_storage_manager
 from plugins.capture_engine import get_capture_engine
+from config import MAX_CONCURRENT_CHECKS, SCHEDULER_COALESCE, SCHEDULER_MAX_INSTANCES
+
+# A check that misses its slot by more than this (e.g. while the pool was
+# saturated) is skipped; with SCHEDULER_COALESCE, runs that piled up are
+# coalesced into one.
+MISFIRE_GRACE_SECONDS = 30
 
 class DomainScheduler:
     """Manages background scheduling for domain monitoring."""
@@ -23,6 +30,19 @@ class DomainScheduler:
         self.monitoring_service = get_monitoring_service()
         self.storage = get_storage_manager()
         self.capture = get_capture_engine()
+        
+        # Number of domain checks currently executing; lets reset wait for
+        # them to finish without shutting the scheduler down.
+        self._running_checks = 0
+        self._checks_idle = threading.Condition()
+        # Bumped by pause_and_clear_jobs; a check scheduled under an older
+        # generation (e.g. handed to the pool but not yet started when a
+        # reset began) does nothing when it runs.
+        self._check_generation = 0
+        # domain_id -> (snapshot id, SHA-256 of that snapshot's HTML) for
+        # snapshots saved without html_sha256, so a check only re-reads the
+        # previous page after a new dump.
+        self._html_digests: dict = {}
     
     def start_scheduler(self) -> None:
         """Start the background scheduler.
@@ -32,7 +52,17 @@ class DomainScheduler:
         if self.scheduler is not None and self.scheduler.running:
             return
         
-        self.scheduler = BackgroundScheduler()
+        # Checks are network-bound, so MAX_CONCURRENT_CHECKS of them overlap
+        # on the pool; a domain runs at most SCHEDULER_MAX_INSTANCES checks at
+        # a time (one by default).
+        self.scheduler = BackgroundScheduler(
+            executors={'default': ThreadPoolExecutor(MAX_CONCURRENT_CHECKS)},
+            job_defaults={
+                'coalesce': SCHEDULER_COALESCE,
+                'max_instances': SCHEDULER_MAX_INSTANCES,
+                'misfire_grace_time': MISFIRE_GRACE_SECONDS,
+            },
+        )
         self.scheduler.start()
         
         domains = self.storage.load_domains()
@@ -49,6 +79,30 @@ class DomainScheduler:
             self.scheduler.shutdown(wait=True)
             self.scheduler = None
     
+    def pause_and_clear_jobs(self) -> None:
+        """Pause the scheduler and drop all scheduled checks.
+        
+        Waits for checks that are already executing to finish, so they cannot
+        write state after the caller proceeds; checks that were submitted but
+        had not started yet are invalidated and return without doing anything.
+        The scheduler's worker threads are kept alive; call resume_scheduler()
+        to continue. Blocks, so call it off the event loop.
+        """
+        if self.scheduler is None or not self.scheduler.running:
+            return
+        
+        with self._checks_idle:
+            self._check_generation += 1
+        self.scheduler.pause()
+        self.scheduler.remove_all_jobs()
+        with self._checks_idle:
+            self._checks_idle.wait_for(lambda: self._running_checks == 0)
+    
+    def resume_scheduler(self) -> None:
+        """Resume a scheduler paused by pause_and_clear_jobs()."""
+        if self.scheduler is not None and self.scheduler.running:
+            self.scheduler.resume()
+    
     def schedule_domain_check(self, domain: Domain) -> None:
         """Schedule periodic checks for a domain.
         
@@ -67,7 +121,7 @@ class DomainScheduler:
         self.scheduler.add_job(
             func=self.check_domain,
             trigger=trigger,
-            args=[domain.id],
+            args=[domain.id, self._check_generation],
             id=job_id,
             name=f"Check domain {domain.url}",
             replace_existing=True
@@ -85,8 +139,28 @@ class DomainScheduler:
         job_id = f"check_domain_{domain_id}"
         if self.scheduler.get_job(job_id):
             self.scheduler.remove_job(job_id)
+        self._html_digests.pop(domain_id, None)
+    
+    def check_domain(self, domain_id: str, generation: Optional[int] = None) -> None:
+        """Run a periodic check for a domain, tracking it as in progress.
+        
+        Args:
+            domain_id: ID of the domain to check
+            generation: Check generation the job was scheduled under; the check
+                is skipped if a reset has started since
+        """
+        with self._checks_idle:
+            if generation is not None and generation != self._check_generation:
+                return
+            self._running_checks += 1
+        try:
+            self._perform_check(domain_id)
+        finally:
+            with self._checks_idle:
+                self._running_checks -= 1
+                self._checks_idle.notify_all()
     
-    def check_domain(self, domain_id: str) -> None:
+    def _perform_check(self, domain_id: str) -> None:
         """Perform a periodic check for a domain with error isolation.
         
         This function:
@@ -108,7 +182,7 @@ class DomainScheduler:
             
             html_content, fetch_success = self.capture.fetch_html(domain.url)
             
-            domain.last_checked_at = datetime.utcnow().isoformat() + 'Z'
+            domain.last_checked_at = utc_now_iso()
             self.storage.save_domain(domain)
             
             if not fetch_success:
@@ -121,9 +195,9 @@ class DomainScheduler:
                 self.storage.append_ping_log(domain_id, ping_entry)
                 return
             
-            snapshots = self.storage.load_snapshots_for_domain(domain_id)
+            latest_snapshot = self.storage.get_latest_snapshot(domain_id)
             
-            if not snapshots:
+            if latest_snapshot is None:
                 ping_entry = PingLogEntry.create(
                     reachable=True,
                     status_code=200,
@@ -133,21 +207,28 @@ class DomainScheduler:
                 self.storage.append_ping_log(domain_id, ping_entry)
                 return
             
-            latest_snapshot = snapshots[-1]
-            
-            try:
-                previous_html = self.storage.load_html(latest_snapshot.html_path)
-            except Exception as e:
-                ping_entry = PingLogEntry.create(
-                    reachable=True,
-                    status_code=200,
-                    change_detected=False,
-                    message=f"Failed to load previous snapshot for comparison: {str(e)}"
-                )
-                self.storage.append_ping_log(domain_id, ping_entry)
-                return
+            cached = self._html_digests.get(domain_id)
+            if latest_snapshot.html_sha256 is not None:
+                previous_digest = latest_snapshot.html_sha256
+            elif cached is not None and cached[0] == latest_snapshot.id:
+                previous_digest = cached[1]
+            else:
+                try:
+                    previous_html = self.storage.load_html(latest_snapshot.html_path)
+                except Exception as e:
+                    ping_entry = PingLogEntry.create(
+                        reachable=True,
+                        status_code=200,
+                        change_detected=False,
+                        message=f"Failed to load previous snapshot for comparison: {str(e)}"
+                    )
+                    self.storage.append_ping_log(domain_id, ping_entry)
+                    return
+                previous_digest = html_digest(previous_html)
+                self._html_digests[domain_id] = (latest_snapshot.id, previous_digest)
             
-            change_detected = self.capture.compare_html(previous_html, html_content)
+            # Equal digests mean identical pages.
+            change_detected = html_digest(html_content) != previous_digest
             
             if change_detected:
                 ping_entry = PingLogEntry.create(
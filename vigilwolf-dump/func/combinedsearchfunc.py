@@ -0,0 +1,94 @@
+import mmap
+import os
+import re
+from itertools import chain
+from multiprocessing import Pool
+
+from fuzzysearch import find_near_matches
+
+# Below this size the scan finishes before worker processes would start.
+PARALLEL_MIN_BYTES = 1 << 20
+
+# Per-worker state set by _init_worker, so each task only carries offsets.
+_worker = {}
+
+
+def combined_search(pattern, filepath, maxchange=1, processes=None):
+    """Regex and fuzzy matches for pattern from a single read of filepath.
+
+    Returns (regex_results, fuzzy_results): the lists regex_search and
+    fuzzy_search return with return_list=True, built from one decode of the
+    file instead of two. Large files are split into newline-aligned ranges
+    scanned by a pool of ``processes`` workers (default: one per CPU); each
+    worker maps the file itself, so only offsets and results are pickled.
+    """
+    re.compile(pattern, re.IGNORECASE)  # Fail on a bad pattern before forking.
+    try:
+        size = os.path.getsize(filepath)
+    except FileNotFoundError:
+        print(f"File not found: {filepath}")
+        return [], []
+    if size == 0:
+        return [], []
+
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or size < PARALLEL_MIN_BYTES:
+        _init_worker(pattern, filepath, maxchange)
+        try:
+            return _scan_range((0, size))
+        finally:
+            _close_worker()
+
+    with Pool(processes, initializer=_init_worker, initargs=(pattern, filepath, maxchange)) as pool:
+        parts = pool.map(_scan_range, _line_ranges(filepath, size, processes))
+    return (
+        list(chain.from_iterable(regex for regex, _ in parts)),
+        list(chain.from_iterable(fuzzy for _, fuzzy in parts)),
+    )
+
+
+def _line_ranges(filepath, size, count):
+    """Split [0, size) into count ranges that each end just after a newline."""
+    with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        ranges = []
+        start = 0
+        for i in range(1, count + 1):
+            end = size if i == count else mm.find(b"\n", max(start, size * i // count)) + 1
+            if end <= 0:
+                end = size
+            if end > start:
+                ranges.append((start, end))
+                start = end
+        return ranges
+
+
+def _init_worker(pattern, filepath, maxchange):
+    with open(filepath, "rb") as f:
+        _worker["mm"] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    _worker["compiled"] = re.compile(pattern, re.IGNORECASE)
+    _worker["pattern"] = pattern
+    _worker["maxchange"] = maxchange
+
+
+def _close_worker():
+    _worker.pop("mm").close()
+    _worker.clear()
+
+
+def _scan_range(bounds):
+    """Regex and fuzzy matches among the lines in mm[start:end]."""
+    start, end = bounds
+    search = _worker["compiled"].search
+    pattern = _worker["pattern"]
+    maxchange = _worker["maxchange"]
+    regex_results = []
+    fuzzy_results = []
+    # bytes.splitlines() breaks on \n, \r and \r\n: the same universal
+    # newlines as iterating the file in text mode.
+    for raw in _worker["mm"][start:end].splitlines():
+        line = raw.decode("utf-8").strip()
+        if search(line):
+            regex_results.append(line)
+        if line and find_near_matches(pattern, line, max_l_dist=maxchange):
+            fuzzy_results.append(line)
+    return regex_results, fuzzy_results
@@ -1,74 +1,102 @@
-import requests
-
-url2 = "https://www.virustotal.com/ui/urls/e2e43c50ed187b3adc68bf141c064c29dffc98e1b0647e2daaf20ca5862aeeea/network_location"
-
-headers2 = {
-    "Accept-Language": "en-US,en;q=0.9,es;q=0.8",
-    "sec-ch-ua-platform": "\"Android\"",
-    "Referer": "https://www.virustotal.com/",
-    "sec-ch-ua": "\"Chromium\";v=\"142\", \"Brave\";v=\"142\", \"Not_A Brand\";v=\"99\"",
-    "X-VT-Anti-Abuse-Header": "MTI2NDAyNTI2NjctWkc5dWRDQmlaU0JsZG1scy0xNzYzMzEwNjgyLjMwMg==",
-    "sec-ch-ua-mobile": "?1",
-    "X-Tool": "vt-ui-main",
-    "x-app-version": "v1x496x0",
-    "User-Agent": "Mozilla/5.0 (Linux; Android 6.0; Nexus 5 Build/MRA58N) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Mobile Safari/537.36",
-    "accept": "application/json",
-    "Content-Type": "application/json"
-}
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import cached_property
 
-# --------------------------------------------------------------------
-# Fetch
-# --------------------------------------------------------------------
-response2 = requests.get(url2, headers=headers2)
-data = response2.json().get("data", {})
-attr = data.get("attributes", {})
+from vt_client import VTClient, parse_json
+
+# Case-insensitive search, without building an uppercased copy of the WHOIS text.
+_REDACTED_RE = re.compile("REDACTED", re.IGNORECASE)
+
+# Looked up when no URL ids are given on the command line.
+DEFAULT_URL_IDS = ("e2e43c50ed187b3adc68bf141c064c29dffc98e1b0647e2daaf20ca5862aeeea",)
+
+# Lookups in flight at once, kept low to stay under VT's rate limit.
+VT_CONCURRENCY = int(os.environ.get("VT_CONCURRENCY", "8"))
 
 # --------------------------------------------------------------------
 # Extract fields
 # --------------------------------------------------------------------
+@dataclass
+class VTResult:
+    """Fields of one network_location payload, each extracted on first access."""
+
+    raw: dict
+
+    @cached_property
+    def attributes(self):
+        return self.raw.get("data", {}).get("attributes", {})
+
+    @cached_property
+    def rdap(self):
+        # Shared by the registrar and nameserver lookups below.
+        return self.attributes.get("rdap", {})
 
-# Registrar
-registrar = None
-entities = attr.get("rdap", {}).get("entities", [])
-for e in entities:
-    if "registrar" in e.get("roles", []):
-        registrar = e.get("vcard_array", [])[1][3]["values"][0] if len(e.get("vcard_array", [])) > 1 else None
-
-# Nameservers
-nameservers = [ns["ldh_name"] for ns in attr.get("rdap", {}).get("nameservers", [])]
-
-# A record (VirusTotal stores this under "last_analysis_results" sometimes, but for domains it's in "resolutions")
-a_record = None
-resolutions = attr.get("last_dns_records", []) or attr.get("last_dns_records", [])
-# Fallback to RDAP if needed
-if resolutions:
-    for r in resolutions:
-        if r.get("type") == "A":
-            a_record = r.get("value")
-
-# WHOIS redacted?
-whois_text = attr.get("whois", "")
-whois_redacted = "REDACTED" in whois_text.upper()
-
-# Domain creation date
-creation_ts = attr.get("creation_date")
-creation_date = None
-if creation_ts:
-    from datetime import datetime
-    creation_date = datetime.utcfromtimestamp(creation_ts).strftime("%Y-%m-%d %H:%M:%S")
-
-# Certificate last seen (use last_https_certificate → validity → not_before)
-cert = attr.get("last_https_certificate", {})
-cert_seen = cert.get("validity", {}).get("not_before")
+    @cached_property
+    def registrar(self):
+        # Last registrar entity wins, as before; scan from the end and stop there.
+        entities = self.rdap.get("entities", [])
+        registrar_entity = next((e for e in reversed(entities) if "registrar" in e.get("roles", [])), None)
+        vcard = registrar_entity.get("vcard_array", []) if registrar_entity else []
+        return vcard[1][3]["values"][0] if len(vcard) > 1 else None
+
+    @cached_property
+    def nameservers(self):
+        return [ns["ldh_name"] for ns in self.rdap.get("nameservers", [])]
+
+    @cached_property
+    def a_record(self):
+        # VirusTotal stores this under "last_analysis_results" sometimes, but for domains it's in "resolutions"
+        resolutions = self.attributes.get("last_dns_records") or []
+        return next((r.get("value") for r in reversed(resolutions) if r.get("type") == "A"), None)
+
+    @cached_property
+    def whois_redacted(self):
+        return _REDACTED_RE.search(self.attributes.get("whois", "")) is not None
+
+    @cached_property
+    def creation_date(self):
+        creation_ts = self.attributes.get("creation_date")
+        # Naive UTC "YYYY-MM-DD HH:MM:SS", formatted without parsing a strftime pattern.
+        return (
+            datetime.fromtimestamp(creation_ts, timezone.utc).replace(tzinfo=None).isoformat(sep=" ", timespec="seconds")
+            if creation_ts else None
+        )
+
+    @cached_property
+    def cert_seen(self):
+        # Certificate last seen (use last_https_certificate → validity → not_before)
+        cert = self.attributes.get("last_https_certificate", {})
+        return cert.get("validity", {}).get("not_before")
+
+def enrich(client, url_id):
+    return VTResult(parse_json(client.url_info(url_id)))
 
 # --------------------------------------------------------------------
 # Print results
 # --------------------------------------------------------------------
-print("\n================ Extracted Info ================")
-print("Registrar:", registrar)
-print("Nameservers:", nameservers)
-print("A Record:", a_record)
-print("WHOIS Redacted:", whois_redacted)
-print("Domain Creation Date:", creation_date)
-print("Certificate Last Seen:", cert_seen)
-print("================================================\n")
+def print_info(url_id, result):
+    print("\n================ Extracted Info ================")
+    print("URL ID:", url_id)
+    print("Registrar:", result.registrar)
+    print("Nameservers:", result.nameservers)
+    print("A Record:", result.a_record)
+    print("WHOIS Redacted:", result.whois_redacted)
+    print("Domain Creation Date:", result.creation_date)
+    print("Certificate Last Seen:", result.cert_seen)
+    print("================================================\n")
+
+if __name__ == "__main__":
+    url_ids = sys.argv[1:] or DEFAULT_URL_IDS
+    # One client for every lookup: its session keeps the HTTPS connections
+    # to VT open across them, retries transient failures with backoff and
+    # caches responses on disk. The worker count bounds how many requests
+    # are in flight.
+    with VTClient(cached=True) as vt, \
+            ThreadPoolExecutor(max_workers=min(VT_CONCURRENCY, len(url_ids))) as pool:
+        results = pool.map(lambda url_id: enrich(vt, url_id), url_ids)
+        for url_id, result in zip(url_ids, results):
+            print_info(url_id, result)
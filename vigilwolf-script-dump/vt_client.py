@@ -0,0 +1,146 @@
+import os
+from types import MappingProxyType
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_CA_BUNDLE_PATH
+from urllib3.util.retry import Retry
+from urllib3.util.ssl_ import create_urllib3_context
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# Advertise Brotli only when urllib3 can decode it; VT's CDN then sends
+# the JSON bodies noticeably smaller than gzip.
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "br, gzip"
+except ImportError:
+    ACCEPT_ENCODING = "gzip"
+
+# Responses are cached on disk next to this module for VT_CACHE_TTL seconds
+# (0 disables), so reruns skip the network and do not use up VT quota.
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "vt_cache")
+CACHE_TTL_SECONDS = int(os.environ.get("VT_CACHE_TTL", "3600"))
+
+BASE_URL = "https://www.virustotal.com/ui"
+SEARCH_URL = BASE_URL + "/search"
+URL_INFO = BASE_URL + "/urls/{}/network_location"
+
+# --------------------------------------------------------------------
+# Headers (built once and frozen)
+# --------------------------------------------------------------------
+# Sent with every request; set as the session defaults.
+COMMON_HEADERS = MappingProxyType({
+    "accept": "application/json",
+    "accept-encoding": ACCEPT_ENCODING,
+    "content-type": "application/json",
+    "referer": "https://www.virustotal.com/",
+    "sec-ch-ua": "\"Chromium\";v=\"142\", \"Brave\";v=\"142\", \"Not_A Brand\";v=\"99\"",
+    "sec-ch-ua-mobile": "?1",
+    "sec-ch-ua-platform": "\"Android\"",
+    "user-agent": "Mozilla/5.0 (Linux; Android 6.0; Nexus 5 Build/MRA58N) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Mobile Safari/537.36",
+    "x-app-version": "v1x496x0",
+    "x-tool": "vt-ui-main",
+})
+
+# Per-endpoint additions, merged over the defaults by requests.
+SEARCH_HEADERS = MappingProxyType({
+    "accept-language": "en-GB,en;q=0.6",
+    "priority": "u=1, i",
+    "sec-fetch-dest": "empty",
+    "sec-fetch-mode": "cors",
+    "sec-fetch-site": "same-origin",
+    "sec-gpc": "1",
+    "x-vt-anti-abuse-header": "MTEzOTk5Mjg4MTQtWkc5dWRDQmlaU0JsZG1scy0xNzYzMzEwNTA5Ljc0Nw==",
+})
+
+URL_INFO_HEADERS = MappingProxyType({
+    "accept-language": "en-US,en;q=0.9,es;q=0.8",
+    "x-vt-anti-abuse-header": "MTI2NDAyNTI2NjctWkc5dWRDQmlaU0JsZG1scy0xNzYzMzEwNjgyLjMwMg==",
+})
+
+
+def parse_json(response):
+    """Decode a VT response body, from the raw bytes when orjson is available."""
+    return orjson.loads(response.content) if orjson is not None else response.json()
+
+
+class _SharedTLSAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections share one SSLContext.
+
+    By default urllib3 builds a fresh context and re-reads the CA bundle for
+    every new TLS connection (~20 ms each), which the concurrent lookups pay
+    once per pooled connection. Here the bundle is loaded once, up front.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._ssl_context = create_urllib3_context()
+        self._ssl_context.load_verify_locations(DEFAULT_CA_BUNDLE_PATH)
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = self._ssl_context
+        super().init_poolmanager(*args, **kwargs)
+
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        # The default bundle is already in the shared context; leaving
+        # ca_certs set would make urllib3 load it again per connection.
+        if verify is True:
+            conn.ca_certs = None
+
+
+class VTClient:
+    """One pooled, retrying session for all VT UI calls made by a process."""
+
+    def __init__(self, cached=False):
+        self.session = self._new_session(cached)
+        self.session.mount("https://", _SharedTLSAdapter(
+            pool_connections=4,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        ))
+        self.session.headers.update(COMMON_HEADERS)
+
+    @staticmethod
+    def _new_session(cached):
+        """Cached session when asked for and requests-cache is installed."""
+        if not cached or requests_cache is None or CACHE_TTL_SECONDS <= 0:
+            return requests.Session()
+        return requests_cache.CachedSession(
+            CACHE_PATH,
+            backend="sqlite",
+            expire_after=CACHE_TTL_SECONDS,
+            allowable_methods=("GET",),
+            # The anti-abuse token rotates; keep it out of the cache key (and
+            # out of the stored request).
+            ignored_parameters=(*requests_cache.DEFAULT_IGNORED_PARAMS, "x-vt-anti-abuse-header"),
+        )
+
+    def search(self, query, limit=2):
+        params = {
+            "limit": limit,
+            "relationships[comment]": "author,item",
+            "query": query,
+        }
+        return self.session.get(SEARCH_URL, params=params, headers=SEARCH_HEADERS)
+
+    def url_info(self, url_id):
+        return self.session.get(URL_INFO.format(url_id), headers=URL_INFO_HEADERS)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()